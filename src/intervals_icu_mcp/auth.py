@@ -1,35 +1,107 @@
 """Authentication and configuration management for Intervals.icu API."""
 
+import contextlib
+import io
 import os
+import stat
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv, set_key
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import load_dotenv
+from dotenv.parser import parse_stream
 
+# Environment variable backing each ICUConfig field
+_ENV_VARS = {
+    "intervals_icu_api_key": "INTERVALS_ICU_API_KEY",
+    "intervals_icu_athlete_id": "INTERVALS_ICU_ATHLETE_ID",
+}
 
-class ICUConfig(BaseSettings):
-    """Intervals.icu API configuration from environment variables."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-    )
+class ICUConfig:
+    """Intervals.icu API configuration from environment variables.
 
-    intervals_icu_api_key: str = ""
-    intervals_icu_athlete_id: str = ""
+    Fields not passed to the constructor are read from the environment on
+    first access and cached on the instance, so unused fields are never resolved.
+    """
+
+    __slots__ = ("intervals_icu_api_key", "intervals_icu_athlete_id")
+
+    intervals_icu_api_key: str
+    intervals_icu_athlete_id: str
+
+    def __init__(
+        self,
+        intervals_icu_api_key: str | None = None,
+        intervals_icu_athlete_id: str | None = None,
+    ) -> None:
+        """Initialize the config, leaving omitted fields to be resolved lazily.
+
+        Args:
+            intervals_icu_api_key: API key (read from INTERVALS_ICU_API_KEY if omitted)
+            intervals_icu_athlete_id: Athlete ID (read from INTERVALS_ICU_ATHLETE_ID if omitted)
+        """
+        if intervals_icu_api_key is not None:
+            object.__setattr__(self, "intervals_icu_api_key", intervals_icu_api_key)
+        if intervals_icu_athlete_id is not None:
+            object.__setattr__(self, "intervals_icu_athlete_id", intervals_icu_athlete_id)
+
+    def __getattr__(self, name: str) -> str:
+        """Resolve an unset field from the environment and cache it."""
+        env_var = _ENV_VARS.get(name)
+        if env_var is None:
+            raise AttributeError(f"'ICUConfig' object has no attribute '{name}'")
+        value = os.environ.get(env_var, "")
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Prevent mutation; ICUConfig is immutable once created."""
+        raise AttributeError(f"ICUConfig is immutable; cannot set '{name}'")
+
+
+_dotenv_loaded = False
+
+
+def load_env_file(override: bool = False) -> None:
+    """Load the .env file into the environment.
+
+    Only the first call reads the file, so every caller shares a single parse.
+
+    Args:
+        override: Re-read the file and let its values replace existing environment variables
+    """
+    global _dotenv_loaded
+    if override or not _dotenv_loaded:
+        load_dotenv(override=override)
+        _dotenv_loaded = True
 
 
+@lru_cache(maxsize=1)
 def load_config() -> ICUConfig:
     """Load configuration from .env file.
 
+    The result is cached for the lifetime of the process; use reload_config()
+    to pick up changes to the environment.
+
     Returns:
         ICUConfig instance with configuration from environment variables
     """
-    load_dotenv()
+    load_env_file()
     return ICUConfig()
 
 
+def reload_config() -> ICUConfig:
+    """Re-read the .env file and load the configuration again.
+
+    Returns:
+        Freshly loaded ICUConfig instance
+    """
+    load_env_file(override=True)
+    load_config.cache_clear()
+    return load_config()
+
+
 def validate_credentials(config: ICUConfig) -> bool:
     """Check if credentials are properly configured.
 
@@ -39,6 +111,7 @@ def validate_credentials(config: ICUConfig) -> bool:
     Returns:
         True if credentials are valid, False otherwise
     """
+    # Check the API key first so the athlete ID is never resolved on failure
     if not config.intervals_icu_api_key or config.intervals_icu_api_key == "your_api_key_here":
         return False
     if not config.intervals_icu_athlete_id or config.intervals_icu_athlete_id == "i123456":
@@ -46,6 +119,51 @@ def validate_credentials(config: ICUConfig) -> bool:
     return True
 
 
+def _format_env_line(key: str, value: str) -> str:
+    """Format a .env line the same way python-dotenv's set_key does."""
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"{key}='{escaped}'\n"
+
+
+def _write_env_values(env_path: Path, values: dict[str, str]) -> None:
+    """Set several keys in a .env file with one read and one atomic write.
+
+    Existing bindings are replaced in place and missing keys are appended;
+    all other lines are preserved verbatim.
+    """
+    exists = env_path.exists()
+    source = env_path.read_text(encoding="utf-8") if exists else ""
+
+    lines: list[str] = []
+    written: set[str] = set()
+    for binding in parse_stream(io.StringIO(source)):
+        if binding.key in values:
+            lines.append(_format_env_line(binding.key, values[binding.key]))
+            written.add(binding.key)
+        else:
+            lines.append(binding.original.string)
+
+    missing = [key for key in values if key not in written]
+    if missing and lines and not lines[-1].endswith("\n"):
+        lines.append("\n")
+    lines.extend(_format_env_line(key, values[key]) for key in missing)
+
+    # The file holds the API key, so a new one is readable by the owner only
+    mode = stat.S_IMODE(env_path.stat().st_mode) if exists else 0o600
+
+    # mkstemp gives a unique, owner-only temp file in the same directory as the target
+    fd, tmp_name = tempfile.mkstemp(dir=env_path.parent, prefix=f".{env_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("".join(lines))
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, env_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
 def update_env_key(api_key: str, athlete_id: str | None = None) -> None:
     """Update the .env file with new credentials.
 
@@ -55,15 +173,13 @@ def update_env_key(api_key: str, athlete_id: str | None = None) -> None:
     """
     env_path = Path.cwd() / ".env"
 
-    # Create .env if it doesn't exist
-    if not env_path.exists():
-        env_path.touch()
+    values = {"INTERVALS_ICU_API_KEY": api_key}
+    if athlete_id:
+        values["INTERVALS_ICU_ATHLETE_ID"] = athlete_id
 
-    # Update API key
-    set_key(str(env_path), "INTERVALS_ICU_API_KEY", api_key)
-    os.environ["INTERVALS_ICU_API_KEY"] = api_key
+    # Write all credentials in a single pass over the file
+    _write_env_values(env_path, values)
+    os.environ.update(values)
 
-    # Update athlete ID if provided
-    if athlete_id:
-        set_key(str(env_path), "INTERVALS_ICU_ATHLETE_ID", athlete_id)
-        os.environ["INTERVALS_ICU_ATHLETE_ID"] = athlete_id
+    # Drop the cached config so the new credentials are picked up
+    load_config.cache_clear()
@@ -1,5 +1,9 @@
 """Async HTTP client for Intervals.icu API."""
 
+import asyncio
+import os
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
@@ -27,6 +31,37 @@ from .models import (
     Workout,
 )
 
+# Responses that mean "not processed, try again later"
+_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+
+def _retry_delay(response: httpx.Response, attempt: int, max_delay: float) -> float | None:
+    """Seconds to wait before retrying a rate-limited or unavailable response.
+
+    Honors a Retry-After header (delta-seconds or HTTP date) and otherwise backs
+    off exponentially (0.5s, 1s, 2s, ...). Returns None when the server asks for
+    a longer wait than max_delay, so the error is reported instead of stalling.
+    """
+    retry_after = response.headers.get("retry-after")
+    delay = 0.5 * 2**attempt
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(UTC)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    return max(delay, 0.0) if delay <= max_delay else None
+
+
+def _max_concurrency(default: int) -> int:
+    """Read the per-client request limit from INTERVALS_ICU_MAX_CONCURRENCY."""
+    try:
+        return max(1, int(os.environ.get("INTERVALS_ICU_MAX_CONCURRENCY", "")))
+    except ValueError:
+        return default
+
 
 class ICUAPIError(Exception):
     """Custom exception for Intervals.icu API errors."""
@@ -58,6 +93,13 @@ class ICUClient:
 
     BASE_URL = "https://intervals.icu/api/v1"
 
+    # Retries for 429/503 responses, and the longest Retry-After worth waiting for
+    MAX_RETRIES = 3
+    MAX_RETRY_DELAY = 30.0
+
+    # Concurrent requests per client, overridable with INTERVALS_ICU_MAX_CONCURRENCY
+    DEFAULT_MAX_CONCURRENCY = 8
+
     def __init__(self, config: ICUConfig):
         """Initialize the Intervals.icu API client.
 
@@ -66,9 +108,12 @@ class ICUClient:
         """
         self.config = config
         self._client: httpx.AsyncClient | None = None
+        self._max_concurrency = _max_concurrency(self.DEFAULT_MAX_CONCURRENCY)
+        # Extra requests wait here instead of timing out in httpx's connection pool
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
 
-    async def __aenter__(self) -> "ICUClient":
-        """Async context manager entry."""
+    def open(self) -> None:
+        """Create the underlying HTTP client, for clients used outside ``async with``."""
         # Use Basic Auth with username "API_KEY" and password as the actual API key
         auth = httpx.BasicAuth(username="API_KEY", password=self.config.intervals_icu_api_key)
 
@@ -76,7 +121,35 @@ class ICUClient:
             base_url=self.BASE_URL,
             timeout=30.0,
             auth=auth,
+            # Keep every connection the semaphore allows alive for reuse
+            limits=httpx.Limits(
+                max_connections=self._max_concurrency,
+                max_keepalive_connections=self._max_concurrency,
+            ),
         )
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection (DNS, TCP and TLS) ahead of the first real request.
+
+        Failures are ignored; the first tool call will simply connect as usual.
+        """
+        if not self._client:
+            raise RuntimeError("Client not initialized. Use async context manager.")
+        try:
+            # Any response leaves a keep-alive connection in the pool
+            await self._client.head(f"/athlete/{self.config.intervals_icu_athlete_id}")
+        except httpx.HTTPError:
+            pass
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "ICUClient":
+        """Async context manager entry."""
+        self.open()
         return self
 
     async def __aexit__(
@@ -86,8 +159,7 @@ class ICUClient:
         exc_tb: object,
     ) -> None:
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        await self.aclose()
 
     async def _request(
         self,
@@ -112,7 +184,19 @@ class ICUClient:
             raise RuntimeError("Client not initialized. Use async context manager.")
 
         try:
-            response = await self._client.request(method, endpoint, **kwargs)
+            # Retries keep their slot, so a rate-limited burst backs off as a whole
+            async with self._semaphore:
+                response = await self._client.request(method, endpoint, **kwargs)
+
+                # Rate limited or temporarily unavailable: wait as instructed and retry
+                for attempt in range(self.MAX_RETRIES):
+                    if response.status_code not in _RETRYABLE_STATUS_CODES:
+                        break
+                    delay = _retry_delay(response, attempt, self.MAX_RETRY_DELAY)
+                    if delay is None:
+                        break
+                    await asyncio.sleep(delay)
+                    response = await self._client.request(method, endpoint, **kwargs)
 
             # Handle specific error codes
             if response.status_code == 401:
@@ -1082,6 +1166,31 @@ class ICUClient:
         )
         return SportSettings(**response.json())
 
+    async def bulk_update_sport_settings(
+        self,
+        settings_list: list[dict[str, Any]],
+        athlete_id: str | None = None,
+    ) -> list[SportSettings]:
+        """Update multiple sport settings in a single request.
+
+        Args:
+            settings_list: Settings data dictionaries, each including the sport settings "id"
+            athlete_id: Athlete ID (uses config default if not provided)
+
+        Returns:
+            List of updated SportSettings objects
+        """
+        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
+        # recalcHrZones is a required query parameter; leave the athlete's HR zones as they are
+        response = await self._request(
+            "PUT",
+            f"/athlete/{athlete_id}/sport-settings",
+            params={"recalcHrZones": "false"},
+            json=settings_list,
+        )
+        adapter = TypeAdapter(list[SportSettings])
+        return adapter.validate_python(response.json())
+
     async def apply_sport_settings(
         self,
         sport_id: int,
@@ -1212,3 +1321,37 @@ class ICUClient:
             json={"start_date_local": new_date},
         )
         return Event(**response.json())
+
+
+# Open clients shared across tool calls, keyed by credentials
+_shared_clients: dict[tuple[str, str], ICUClient] = {}
+
+
+def get_client(config: ICUConfig) -> ICUClient:
+    """Get the shared, already-open client for a config's credentials.
+
+    Unlike ``async with ICUClient(config)``, the client is not closed after each
+    tool call, so keep-alive connections (and their TLS sessions) are reused.
+    Call close_clients() on shutdown.
+
+    Args:
+        config: ICUConfig with API credentials
+
+    Returns:
+        Open ICUClient for the config's API key and athlete ID
+    """
+    key = (config.intervals_icu_api_key, config.intervals_icu_athlete_id)
+    client = _shared_clients.get(key)
+    if client is None:
+        client = ICUClient(config)
+        client.open()
+        _shared_clients[key] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close every client handed out by get_client."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -1,8 +1,53 @@
 """Data formatting utilities for displaying Intervals.icu data."""
 
-from datetime import datetime
+import bisect
+from datetime import UTC, datetime, timedelta, timezone
+from functools import lru_cache
+from statistics import fmean
 from typing import Literal
 
+# strftime formats used by format_date
+_FMT_DATE = "%Y-%m-%d"
+_FMT_DATETIME = "%Y-%m-%d %H:%M"
+
+# TSB status buckets: a value strictly above _TSB_THRESH[i] maps past _TSB_LABELS[i]
+_TSB_THRESH = (-30, -10, 5, 20)
+_TSB_LABELS = ("Very Fatigued ⚠️", "Fatigued ⚠️", "Optimal", "Recovered", "Fresh 🟢")
+
+# Wellness indicators for values below 40%, from 40%, from 60% and from 80% of the scale,
+# with the separating space included so the result never needs stripping
+_WELLNESS_INDICATORS = (" 🔴", "", " 🟡", " 🟢")
+
+
+@lru_cache(maxsize=64)
+def _fixed_offset(offset: timedelta) -> timezone:
+    """Return a shared tzinfo for a UTC offset."""
+    return timezone(offset)
+
+
+def _parse_iso_stdlib(value: str) -> datetime:
+    """Parse an ISO-8601 string, sharing tzinfo objects across equal offsets.
+
+    fromisoformat accepts a trailing "Z" on Python 3.11+ and already returns the
+    UTC singleton for zero offsets; other offsets get a fresh timezone
+    per call, which is swapped for a cached instance.
+    """
+    dt = datetime.fromisoformat(value)
+    tz = dt.tzinfo
+    if tz is not None and tz is not UTC:
+        offset = dt.utcoffset()
+        if offset is not None:
+            dt = dt.replace(tzinfo=_fixed_offset(offset))
+    return dt
+
+
+# Use the ciso8601 C parser (which caches its own offsets) when the "speedups"
+# extra is installed
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:  # pragma: no cover - optional dependency
+    parse_iso_datetime = _parse_iso_stdlib
+
 
 def format_duration(seconds: int | None) -> str:
     """Format duration in seconds to human-readable string.
@@ -16,19 +61,17 @@ def format_duration(seconds: int | None) -> str:
     if seconds is None or seconds < 0:
         return "0s"
 
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
 
-    parts: list[str] = []
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if secs > 0 or not parts:
-        parts.append(f"{secs}s")
-
-    return " ".join(parts)
+    # Zero components are omitted, except seconds when nothing else is shown
+    if hours:
+        if minutes:
+            return f"{hours}h {minutes}m {secs}s" if secs else f"{hours}h {minutes}m"
+        return f"{hours}h {secs}s" if secs else f"{hours}h"
+    if minutes:
+        return f"{minutes}m {secs}s" if secs else f"{minutes}m"
+    return f"{secs}s"
 
 
 def format_distance(
@@ -146,15 +189,23 @@ def format_date(dt: datetime | str | None, include_time: bool = False) -> str:
         return "N/A"
 
     if isinstance(dt, str):
+        # API strings already start with YYYY-MM-DD, so the date can be sliced off
+        if (
+            not include_time
+            and len(dt) >= 10
+            and dt[4] == "-"
+            and dt[7] == "-"
+            and dt[:4].isdigit()
+            and dt[5:7].isdigit()
+            and dt[8:10].isdigit()
+        ):
+            return dt[:10]
         try:
-            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+            dt = parse_iso_datetime(dt)
         except ValueError:
             return dt
 
-    if include_time:
-        return dt.strftime("%Y-%m-%d %H:%M")
-    else:
-        return dt.strftime("%Y-%m-%d")
+    return dt.strftime(_FMT_DATETIME if include_time else _FMT_DATE)
 
 
 def format_date_relative(dt: datetime | str | None) -> str:
@@ -171,7 +222,7 @@ def format_date_relative(dt: datetime | str | None) -> str:
 
     if isinstance(dt, str):
         try:
-            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+            dt = parse_iso_datetime(dt)
         except ValueError:
             return dt
 
@@ -283,21 +334,18 @@ def format_tsb(tsb: float | None) -> str:
     if tsb is None:
         return "N/A"
 
-    # Interpret TSB
-    if tsb > 20:
-        status = "Fresh 🟢"
-    elif tsb > 5:
-        status = "Recovered"
-    elif tsb > -10:
-        status = "Optimal"
-    elif tsb > -30:
-        status = "Fatigued ⚠️"
-    else:
-        status = "Very Fatigued ⚠️"
+    # Interpret TSB (bisect_left keeps the thresholds exclusive)
+    status = _TSB_LABELS[bisect.bisect_left(_TSB_THRESH, tsb)]
 
     return f"{tsb:+.1f} ({status})"
 
 
+@lru_cache(maxsize=8)
+def _wellness_thresholds(scale: int) -> tuple[float, float, float]:
+    """Return the indicator thresholds for a wellness scale."""
+    return (scale * 0.4, scale * 0.6, scale * 0.8)
+
+
 def format_wellness_value(value: int | None, scale: int = 10) -> str:
     """Format wellness value (1-10 scale).
 
@@ -311,17 +359,10 @@ def format_wellness_value(value: int | None, scale: int = 10) -> str:
     if value is None:
         return "N/A"
 
-    # Visual representation
-    if value >= scale * 0.8:
-        indicator = "🟢"
-    elif value >= scale * 0.6:
-        indicator = "🟡"
-    elif value >= scale * 0.4:
-        indicator = ""
-    else:
-        indicator = "🔴"
+    # Visual representation (bisect_right keeps the thresholds inclusive)
+    indicator = _WELLNESS_INDICATORS[bisect.bisect_right(_wellness_thresholds(scale), value)]
 
-    return f"{value}/{scale} {indicator}".strip()
+    return f"{value}/{scale}{indicator}"
 
 
 def calculate_avg(values: list[int] | list[float]) -> float:
@@ -333,9 +374,8 @@ def calculate_avg(values: list[int] | list[float]) -> float:
     Returns:
         Average value
     """
-    if not values:
-        return 0.0
-    return sum(values) / len(values)
+    # fmean accumulates with math.fsum, avoiding rounding drift on long streams
+    return fmean(values) if values else 0.0
 
 
 def format_weight(kg: float | None, unit: Literal["metric", "imperial"] = "metric") -> str:
@@ -9,7 +9,8 @@ from typing import Any
 from fastmcp.exceptions import ToolError
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
-from .auth import load_config, validate_credentials
+from .auth import load_config, reload_config, validate_credentials
+from .client import get_client
 
 
 class ConfigMiddleware(Middleware):
@@ -17,9 +18,10 @@ class ConfigMiddleware(Middleware):
 
     This middleware:
     1. Loads the ICU config from environment variables
-    2. Validates that credentials are properly configured
+    2. Validates that credentials are properly configured, re-reading .env once if not
     3. Injects the config into the context state for tools to access via ctx.get_state("config")
-    4. Raises ToolError if authentication is not configured
+    4. Injects a shared, already-open ICUClient via ctx.get_state("client")
+    5. Raises ToolError if authentication is not configured
     """
 
     async def on_call_tool(self, context: MiddlewareContext, call_next: Callable[..., Any]):
@@ -27,6 +29,11 @@ class ConfigMiddleware(Middleware):
         # Load configuration from environment
         config = load_config()
 
+        # Credentials may have been set up (e.g. with icu-mcp-auth) since the config was
+        # cached, so re-read .env once before rejecting the call
+        if not validate_credentials(config):
+            config = reload_config()
+
         # Validate credentials are properly configured
         if not validate_credentials(config):
             raise ToolError(
@@ -34,9 +41,10 @@ class ConfigMiddleware(Middleware):
                 "Please run 'icu-mcp-auth' to set up authentication."
             )
 
-        # Inject config into context state for tools to access
+        # Inject config and the shared client into context state for tools to access
         if context.fastmcp_context:
             context.fastmcp_context.set_state("config", config)
+            context.fastmcp_context.set_state("client", get_client(config))
 
         # Continue to the tool execution
         return await call_next(context)
@@ -11,19 +11,71 @@ across all MCP tools. All tools return JSON with a standard structure:
 """
 
 import json
-from datetime import datetime
-from typing import Any, cast
-
-
-def _convert_datetimes(obj: Any) -> Any:  # type: ignore[misc]
-    """Recursively convert datetime objects to ISO strings."""
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from .formatters import parse_iso_datetime
+
+# orjson (from the "speedups" extra) serializes datetimes natively in C
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# English day/month names, matching strftime's %A/%B in the default C locale
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Last generated timestamp, as (epoch seconds, ISO string)
+_last_ts: tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO string, reused within the same millisecond."""
+    global _last_ts
+    now = time.time()
+    last, iso = _last_ts
+    if 0.0 <= now - last < 0.001:
+        return iso
+    # A fixed UTC tzinfo avoids resolving local timezone rules on every call
+    iso = datetime.fromtimestamp(now, UTC).isoformat()
+    _last_ts = (now, iso)
+    return iso
+
+
+def _json_default(obj: Any) -> str:
+    """Convert datetime objects to ISO strings for json.dumps."""
     if isinstance(obj, datetime):
         return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {str(k): _convert_datetimes(v) for k, v in obj.items()}  # type: ignore[misc]
-    elif isinstance(obj, list):
-        return [_convert_datetimes(item) for item in obj]  # type: ignore[misc]
-    return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: dict[str, Any]) -> str:
+    """Serialize a response dict to compact JSON, converting datetimes to ISO strings."""
+    if orjson is not None:
+        # Keys are almost always str, and OPT_NON_STR_KEYS slows down str keys,
+        # so only opt in when orjson rejects a non-str key
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    # Only datetimes reach the default hook; everything else stays in the C encoder
+    return json.dumps(obj, separators=(",", ":"), default=_json_default)
 
 
 class ResponseBuilder:
@@ -43,18 +95,22 @@ class ResponseBuilder:
             return None
 
         # Parse the datetime if it's a string, otherwise use it directly
-        if isinstance(dt, str):
-            parsed_dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-        else:
-            parsed_dt = dt
+        parsed_dt = parse_iso_datetime(dt) if isinstance(dt, str) else dt
+
+        # Built from the datetime fields directly rather than three strftime calls
+        year, month, day, hour = parsed_dt.year, parsed_dt.month, parsed_dt.day, parsed_dt.hour
+        day_of_week = _WEEKDAYS[parsed_dt.weekday()]  # e.g., "Monday"
+        meridiem = "AM" if hour < 12 else "PM"
 
         return {
             "datetime": dt if isinstance(dt, str) else dt.isoformat(),
-            "date": parsed_dt.strftime("%Y-%m-%d"),
-            "day_of_week": parsed_dt.strftime("%A"),  # e.g., "Monday"
-            "formatted": parsed_dt.strftime(
-                "%A, %B %d, %Y at %I:%M %p"
-            ),  # e.g., "Monday, October 15, 2025 at 02:30 PM"
+            "date": f"{year}-{month:02d}-{day:02d}",
+            "day_of_week": day_of_week,
+            # e.g., "Monday, October 15, 2025 at 02:30 PM"
+            "formatted": (
+                f"{day_of_week}, {_MONTHS[month - 1]} {day:02d}, {year} "
+                f"at {hour % 12 or 12:02d}:{parsed_dt.minute:02d} {meridiem}"
+            ),
         }
 
     @staticmethod
@@ -78,33 +134,27 @@ class ResponseBuilder:
                 "data": {...},
                 "analysis": {...},
                 "metadata": {
-                    "fetched_at": "ISO timestamp",
+                    "fetched_at": "ISO timestamp (UTC)",
                     "query_type": "...",
                     ...
                 }
             }
         """
-        # Convert datetime objects to ISO strings
-        converted_data = cast(dict[str, Any], _convert_datetimes(data))
-        converted_analysis: dict[str, Any] | None = None
-        if analysis:
-            converted_analysis = cast(dict[str, Any], _convert_datetimes(analysis))
+        response: dict[str, Any] = {"data": data}
 
-        response: dict[str, Any] = {"data": converted_data}
-
-        if converted_analysis:
-            response["analysis"] = converted_analysis
+        if analysis:
+            response["analysis"] = analysis
 
-        # Build metadata with timestamp
-        meta = metadata or {}
-        converted_meta = cast(dict[str, Any], _convert_datetimes(meta))
-        converted_meta["fetched_at"] = datetime.now().isoformat()
+        # Build metadata with timestamp (copied so the caller's dict is not mutated)
+        meta: dict[str, Any] = dict(metadata) if metadata else {}
+        meta["fetched_at"] = _now_iso()
         if query_type:
-            converted_meta["query_type"] = query_type
+            meta["query_type"] = query_type
 
-        response["metadata"] = converted_meta
+        response["metadata"] = meta
 
-        return json.dumps(response, separators=(",", ":"))
+        # Datetime objects are converted to ISO strings during serialization
+        return _dumps(response)
 
     @staticmethod
     def build_error_response(
@@ -126,11 +176,11 @@ class ResponseBuilder:
             "error": {
                 "message": error_message,
                 "type": error_type,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
             }
         }
 
         if suggestions:
             response["error"]["suggestions"] = suggestions
 
-        return json.dumps(response, separators=(",", ":"))
+        return _dumps(response)
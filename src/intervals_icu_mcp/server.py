@@ -1,15 +1,42 @@
 """Intervals.icu MCP Server - FastMCP entry point."""
 
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from typing import Any
 
-from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-# Load environment variables
-load_dotenv()
+from .auth import load_config, load_env_file, validate_credentials
+from .client import ICUAPIError, ICUClient, close_clients, get_client
+from .response_builder import ResponseBuilder
+
+# Load environment variables (shared with load_config, so .env is parsed once)
+load_env_file()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncGenerator[None]:
+    """Warm the shared API client on startup and close shared clients on shutdown."""
+    config = load_config()
+    warm_up = None
+    if validate_credentials(config):
+        # In the background, so a slow or unreachable API never delays startup
+        warm_up = asyncio.create_task(get_client(config).warm_up())
+    try:
+        yield
+    finally:
+        if warm_up is not None:
+            # Let the task finish unwinding so no request is left on a closing client
+            warm_up.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await warm_up
+        await close_clients()
+
 
 # Initialize FastMCP server
-mcp = FastMCP("Intervals.icu")
+mcp = FastMCP("Intervals.icu", lifespan=lifespan)
 
 # Register middleware
 from .middleware import ConfigMiddleware
@@ -62,6 +89,7 @@ from .tools.gear import (
 from .tools.performance import get_power_curves
 from .tools.sport_settings import (
     apply_sport_settings,
+    bulk_update_sport_settings,
     create_sport_settings,
     delete_sport_settings,
     get_sport_settings,
@@ -134,6 +162,7 @@ mcp.tool()(update_gear_reminder)
 # Register sport settings tools
 mcp.tool()(get_sport_settings)
 mcp.tool()(update_sport_settings)
+mcp.tool()(bulk_update_sport_settings)
 mcp.tool()(apply_sport_settings)
 mcp.tool()(create_sport_settings)
 mcp.tool()(delete_sport_settings)
@@ -143,10 +172,6 @@ mcp.tool()(delete_sport_settings)
 @mcp.resource("intervals-icu://athlete/profile")
 async def athlete_profile_resource() -> str:
     """Complete athlete profile with fitness metrics and sport settings for context."""
-    from .auth import load_config
-    from .client import ICUAPIError, ICUClient
-    from .response_builder import ResponseBuilder
-
     # Load config directly since resources don't go through middleware
     config = load_config()
 
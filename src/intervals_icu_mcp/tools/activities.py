@@ -1,5 +1,7 @@
 """Activity-related tools for Intervals.icu MCP server."""
 
+import base64
+import os
 from datetime import datetime, timedelta
 from typing import Annotated, Any
 
@@ -489,8 +491,6 @@ async def download_activity_file(
 
             if output_path:
                 # Save to file
-                import os
-
                 os.makedirs(
                     os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
                     exist_ok=True,
@@ -509,8 +509,6 @@ async def download_activity_file(
                 )
             else:
                 # Return base64 encoded
-                import base64
-
                 encoded = base64.b64encode(file_content).decode("utf-8")
 
                 return ResponseBuilder.build_response(
@@ -557,8 +555,6 @@ async def download_fit_file(
 
             if output_path:
                 # Save to file
-                import os
-
                 os.makedirs(
                     os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
                     exist_ok=True,
@@ -578,8 +574,6 @@ async def download_fit_file(
                 )
             else:
                 # Return base64 encoded
-                import base64
-
                 encoded = base64.b64encode(file_content).decode("utf-8")
 
                 return ResponseBuilder.build_response(
@@ -627,8 +621,6 @@ async def download_gpx_file(
 
             if output_path:
                 # Save to file
-                import os
-
                 os.makedirs(
                     os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
                     exist_ok=True,
@@ -648,8 +640,6 @@ async def download_gpx_file(
                 )
             else:
                 # Return base64 encoded
-                import base64
-
                 encoded = base64.b64encode(file_content).decode("utf-8")
 
                 return ResponseBuilder.build_response(
@@ -0,0 +1,48 @@
+"""Shared exception handling for MCP tools."""
+
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, ParamSpec
+
+from ..client import ICUAPIError
+from ..response_builder import ResponseBuilder
+
+_P = ParamSpec("_P")
+
+
+def icu_tool_errors(
+    *,
+    bad_request: Callable[[ICUAPIError], str] | None = None,
+    unexpected_error_type: str = "internal_error",
+    unexpected_prefix: str = "Unexpected error: ",
+) -> Callable[[Callable[_P, Coroutine[Any, Any, str]]], Callable[_P, Coroutine[Any, Any, str]]]:
+    """Build a decorator that maps exceptions raised by a tool to standard error responses.
+
+    Args:
+        bad_request: Builds the response for a 400 from the API (default: api_error)
+        unexpected_error_type: Error type for exceptions other than ICUAPIError
+        unexpected_prefix: Text placed before the message of an unexpected exception
+
+    Returns:
+        Decorator for async tool functions that return JSON strings
+    """
+
+    def decorator(
+        func: Callable[_P, Coroutine[Any, Any, str]],
+    ) -> Callable[_P, Coroutine[Any, Any, str]]:
+        @wraps(func)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> str:
+            try:
+                return await func(*args, **kwargs)
+            except ICUAPIError as e:
+                if e.status_code == 400 and bad_request is not None:
+                    return bad_request(e)
+                return ResponseBuilder.build_error_response(e.message, error_type="api_error")
+            except Exception as e:
+                return ResponseBuilder.build_error_response(
+                    f"{unexpected_prefix}{str(e)}", error_type=unexpected_error_type
+                )
+
+        return wrapper
+
+    return decorator
@@ -1,15 +1,103 @@
 """Event/calendar management tools for Intervals.icu MCP server."""
 
+import json
 from datetime import datetime
-from typing import Annotated, Any
+from functools import lru_cache
+from typing import Annotated, Any, cast
 
 from fastmcp import Context
 
-from ..auth import ICUConfig
 from ..client import ICUAPIError, ICUClient
+from ..models import Event
 from ..response_builder import ResponseBuilder
+from .errors import icu_tool_errors
 
+# orjson (from the "speedups" extra) parses large bulk payloads several times faster
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
+
+def _loads(text: str) -> Any:
+    """Parse a JSON tool argument, using orjson when it is installed.
+
+    Both parsers raise json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# strptime formats accepted for event start dates, most specific first
+_DATE_FORMATS_WITH_T = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M")
+_DATE_FORMATS_ALL = (*_DATE_FORMATS_WITH_T, "%Y-%m-%d")
+
+# (start, end) offsets of each numeric field in YYYY-MM-DDTHH:MM:SS
+_ISO_FIELD_SLICES = ((0, 4), (5, 7), (8, 10), (11, 13), (14, 16), (17, 19))
+
+
+def _parse_fixed_width_datetime(date_str: str) -> str | None:
+    """Fast path for zero-padded YYYY-MM-DD, YYYY-MM-DDTHH:MM and YYYY-MM-DDTHH:MM:SS.
+
+    Returns the API datetime string, or None so the caller can fall back to strptime.
+    """
+    length = len(date_str)
+    if length == 10:
+        suffix, field_count = "T00:00:00", 3
+    elif length == 16:
+        suffix, field_count = ":00", 5
+    elif length == 19:
+        suffix, field_count = "", 6
+    else:
+        return None
+
+    # Years below 1000 are left to strptime/strftime, which do not zero-pad them
+    if not date_str.isascii() or date_str[0] == "0" or date_str[4] != "-" or date_str[7] != "-":
+        return None
+    if length > 10 and (
+        date_str[10] != "T" or date_str[13] != ":" or (length == 19 and date_str[16] != ":")
+    ):
+        return None
+
+    parts = [date_str[start:end] for start, end in _ISO_FIELD_SLICES[:field_count]]
+    if not all(part.isdigit() for part in parts):
+        return None
+    year, month, day, hour, minute, second = [int(part) for part in parts] + [0] * (6 - field_count)
+    try:
+        # Only used to range-check month/day/hour/minute/second
+        datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+    return date_str + suffix
+
+
+def _is_valid_event_date(date_str: str) -> bool:
+    """Check a date against the accepted formats without any YYYY-MM-DD prefix fallback."""
+    if _parse_fixed_width_datetime(date_str) is not None:
+        return True
+    for fmt in _DATE_FORMATS_ALL:
+        try:
+            datetime.strptime(date_str, fmt)
+            return True
+        except ValueError:
+            continue
+    return False
+
+
+def _is_valid_date(date_str: str) -> bool:
+    """Check a date-only string the way datetime.strptime(date_str, "%Y-%m-%d") would."""
+    if len(date_str) == 10 and _parse_fixed_width_datetime(date_str) is not None:
+        return True
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+        return True
+    except ValueError:
+        return False
+
+
+# Bulk plans repeat the same few dates, and the result depends only on the input
+@lru_cache(maxsize=4096)
 def parse_start_date_local(date_str: str) -> str:
     """Parse a date or datetime string and return ISO format for Intervals.icu API.
 
@@ -21,8 +109,13 @@ def parse_start_date_local(date_str: str) -> str:
     Returns:
         ISO format string like "2025-12-08T15:00:00"
     """
+    fast = _parse_fixed_width_datetime(date_str)
+    if fast is not None:
+        return fast
+
+    # Slow path for looser input strptime still accepts (e.g. unpadded fields)
     if "T" in date_str:
-        for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M"]:
+        for fmt in _DATE_FORMATS_WITH_T:
             try:
                 dt = datetime.strptime(date_str, fmt)
                 return dt.strftime("%Y-%m-%dT%H:%M:%S")
@@ -44,6 +137,10 @@ VALID_CATEGORIES = [
     "SEASON_START", "TARGET", "SET_FITNESS",
 ]
 
+# Hashed membership for validation; the list above keeps the display order
+_VALID_CATEGORIES_SET = frozenset(VALID_CATEGORIES)
+_VALID_CATEGORIES_STR = ", ".join(VALID_CATEGORIES)
+
 # Auto-correct common category mistakes to valid API values
 _CATEGORY_ALIASES = {
     "RACE": "RACE_A",
@@ -53,6 +150,10 @@ _CATEGORY_ALIASES = {
     "FTP": "SET_EFTP",
 }
 
+# Constant error-message fragments, joined once instead of on every failure
+_CATEGORY_HINTS = ", ".join(f"{alias}→{target}" for alias, target in _CATEGORY_ALIASES.items())
+_VALID_CATEGORIES_SAMPLE_STR = ", ".join(VALID_CATEGORIES[:5])
+
 # Valid sport/activity types accepted by the API
 _VALID_TYPES = [
     "Ride", "Run", "Swim", "WeightTraining", "Hike", "Walk",
@@ -66,6 +167,43 @@ _VALID_TYPES = [
     "Windsurf", "Workout", "Yoga", "Other",
 ]
 
+_VALID_TYPES_SET = frozenset(_VALID_TYPES)
+
+# Case-insensitive lookups, built once instead of on every normalization
+_TYPE_LOOKUP = {t.lower(): t for t in _VALID_TYPES}
+_VALID_TYPES_LOWER_PAIRS = tuple((t, t.lower()) for t in _VALID_TYPES)
+
+
+def _build_type_substring_index() -> dict[str, tuple[str, ...]]:
+    """Map every lowercase substring of a type name to the types containing it.
+
+    Types are listed in _VALID_TYPES order, so lookups match the order of a linear scan.
+    """
+    index: dict[str, list[str]] = {}
+    for event_type, lower in _VALID_TYPES_LOWER_PAIRS:
+        substrings = {lower[i:j] for i in range(len(lower)) for j in range(i + 1, len(lower) + 1)}
+        substrings.add("")
+        for substring in substrings:
+            index.setdefault(substring, []).append(event_type)
+    return {substring: tuple(types) for substring, types in index.items()}
+
+
+# ~1k entries; turns "input is part of a type name" into a single dict lookup
+_TYPE_SUBSTRING_INDEX = _build_type_substring_index()
+_TYPE_ORDER = {t: i for i, t in enumerate(_VALID_TYPES)}
+
+
+def _partial_type_matches(lower: str) -> list[str]:
+    """Return types whose name contains, or is contained in, a lowercase input."""
+    contained_in = _TYPE_SUBSTRING_INDEX.get(lower, ())
+    # The reverse direction (a type name inside a longer input) still needs a scan
+    containing = [t for t, t_lower in _VALID_TYPES_LOWER_PAIRS if t_lower in lower]
+    if not containing:
+        return list(contained_in)
+    if not contained_in:
+        return containing
+    return sorted(set(contained_in).union(containing), key=_TYPE_ORDER.__getitem__)
+
 # Known API field names for events (to detect typos/wrong names)
 _VALID_EVENT_FIELDS = {
     "start_date_local", "end_date_local", "name", "category", "type",
@@ -74,6 +212,7 @@ _VALID_EVENT_FIELDS = {
     "athlete_cannot_edit", "hide_from_athlete", "target",
     "carbs_per_hour", "sub_type", "not_on_fitness_chart",
 }
+_VALID_EVENT_FIELDS_STR = ", ".join(sorted(_VALID_EVENT_FIELDS))
 
 # Common field name mistakes → correct field name
 _FIELD_ALIASES = {
@@ -92,8 +231,15 @@ _FIELD_ALIASES = {
     "distance_meters": "distance",
     "title": "name",
 }
+_FIELD_ALIASES_KEYS = frozenset(_FIELD_ALIASES)
 
+# Fields every bulk event must provide, in the order they are reported
+_REQUIRED_EVENT_FIELDS = ("start_date_local", "name", "category")
+_REQUIRED_EVENT_FIELDS_SET = frozenset(_REQUIRED_EVENT_FIELDS)
 
+
+# Plans reuse a handful of categories and types, so both normalizers are memoized
+@lru_cache(maxsize=128)
 def _normalize_category(category: str) -> str:
     """Normalize an event category, auto-correcting common mistakes.
 
@@ -105,29 +251,28 @@ def _normalize_category(category: str) -> str:
     if upper in _CATEGORY_ALIASES:
         return _CATEGORY_ALIASES[upper]
     # Already valid
-    if upper in VALID_CATEGORIES:
+    if upper in _VALID_CATEGORIES_SET:
         return upper
     # Unknown category
     raise ValueError(
         f"Invalid category '{category}'. "
-        f"Must be one of: {', '.join(VALID_CATEGORIES)}. "
-        f"Common aliases: RACE→RACE_A, GOAL→TARGET, REST→HOLIDAY, "
-        f"INJURY→INJURED, FTP→SET_EFTP."
+        f"Must be one of: {_VALID_CATEGORIES_STR}. "
+        f"Common aliases: {_CATEGORY_HINTS}."
     )
 
 
+@lru_cache(maxsize=128)
 def _normalize_event_type(event_type: str) -> str:
     """Normalize an activity/sport type, auto-correcting case mismatches.
 
     Returns the correctly-cased type if found. Raises ValueError if unknown.
     """
-    # Build a case-insensitive lookup
-    type_lookup = {t.lower(): t for t in _VALID_TYPES}
     lower = event_type.lower()
-    if lower in type_lookup:
-        return type_lookup[lower]
+    hit = _TYPE_LOOKUP.get(lower)
+    if hit is not None:
+        return hit
     # Try partial match
-    matches = [t for t in _VALID_TYPES if lower in t.lower() or t.lower() in lower]
+    matches = _partial_type_matches(lower)
     if len(matches) == 1:
         return matches[0]
     if matches:
@@ -143,49 +288,62 @@ def _normalize_event_type(event_type: str) -> str:
     )
 
 
+# Exact JSON number types; unlike isinstance this rejects bool (an int subclass)
+_NUMBER_TYPES = frozenset({int, float})
+
+# Fixed suggestions for a payload that is not a JSON object
+_PAYLOAD_TYPE_SUGGESTIONS = (
+    "Payload must be a JSON object with string keys.",
+    "Required keys: start_date_local, name, category.",
+    "Example: {\"start_date_local\": \"2026-03-01\", "
+    "\"name\": \"Easy Ride\", \"category\": \"WORKOUT\", "
+    "\"type\": \"Ride\"}",
+)
+
+
 def _diagnose_event_error(error: ICUAPIError) -> str:
     """Analyze a 400 API error and return actionable suggestions for the agent.
 
     Inspects the request payload to identify common mistakes and returns
     specific guidance on how to fix them.
     """
-    suggestions: list[str] = []
-    payload = error.request_payload or {}
+    raw_payload: Any = error.request_payload or {}
 
-    if not isinstance(payload, dict):
+    if not isinstance(raw_payload, dict):
         return ResponseBuilder.build_error_response(
             "The event payload must be a JSON object (dict), not a "
-            f"{type(payload).__name__}. Build a dict with keys like "
+            f"{type(raw_payload).__name__}. Build a dict with keys like "
             "'start_date_local', 'name', 'category', 'type', etc.",
             error_type="validation_error",
-            suggestions=[
-                "Payload must be a JSON object with string keys.",
-                "Required keys: start_date_local, name, category.",
-                "Example: {\"start_date_local\": \"2026-03-01\", "
-                "\"name\": \"Easy Ride\", \"category\": \"WORKOUT\", "
-                "\"type\": \"Ride\"}",
-            ],
+            suggestions=list(_PAYLOAD_TYPE_SUGGESTIONS),
         )
 
-    # Check for wrong field names
-    for key in list(payload.keys()):
-        if key in _FIELD_ALIASES:
-            correct = _FIELD_ALIASES[key]
-            suggestions.append(
-                f"Field '{key}' is not a valid API field. "
-                f"Use '{correct}' instead."
-            )
-        elif key not in _VALID_EVENT_FIELDS:
-            suggestions.append(
-                f"Unknown field '{key}'. Valid fields: "
-                f"{', '.join(sorted(_VALID_EVENT_FIELDS))}."
-            )
+    payload = cast(dict[str, Any], raw_payload)
+    suggestions: list[str] = []
+
+    # Check for wrong field names. One set difference finds them all; the payload
+    # is only walked (to keep suggestions in key order) when there is something to report
+    invalid_keys = payload.keys() - _VALID_EVENT_FIELDS
+    if invalid_keys:
+        for key in payload:
+            if key not in invalid_keys:
+                continue
+            correct = _FIELD_ALIASES.get(key)
+            if correct is not None:
+                suggestions.append(
+                    f"Field '{key}' is not a valid API field. "
+                    f"Use '{correct}' instead."
+                )
+            else:
+                suggestions.append(
+                    f"Unknown field '{key}'. Valid fields: {_VALID_EVENT_FIELDS_STR}."
+                )
 
     # Check category
     cat = payload.get("category", "")
     if cat and isinstance(cat, str):
         upper_cat = cat.upper()
-        if upper_cat not in VALID_CATEGORIES:
+        if upper_cat not in _VALID_CATEGORIES_SET:
             if upper_cat in _CATEGORY_ALIASES:
                 suggestions.append(
                     f"Category '{cat}' is invalid. "
@@ -194,23 +352,14 @@ def _diagnose_event_error(error: ICUAPIError) -> str:
             else:
                 suggestions.append(
                     f"Category '{cat}' is not valid. "
-                    f"Must be one of: {', '.join(VALID_CATEGORIES)}. "
-                    f"Common mappings: RACE→RACE_A, GOAL→TARGET, "
-                    f"REST→HOLIDAY, INJURY→INJURED, FTP→SET_EFTP."
+                    f"Must be one of: {_VALID_CATEGORIES_STR}. "
+                    f"Common mappings: {_CATEGORY_HINTS}."
                 )
 
     # Check date format
     date_val = payload.get("start_date_local", "")
     if date_val and isinstance(date_val, str):
-        valid_date = False
-        for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d"]:
-            try:
-                datetime.strptime(date_val, fmt)
-                valid_date = True
-                break
-            except ValueError:
-                continue
-        if not valid_date:
+        if not _is_valid_event_date(date_val):
             suggestions.append(
                 f"Date '{date_val}' has invalid format. "
                 f"Use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS. "
@@ -230,10 +379,9 @@ def _diagnose_event_error(error: ICUAPIError) -> str:
     # Check type (sport type)
     type_val = payload.get("type", "")
     if type_val and isinstance(type_val, str):
-        if type_val not in _VALID_TYPES:
+        if type_val not in _VALID_TYPES_SET:
             # Find close matches
-            lower_type = type_val.lower()
-            close = [t for t in _VALID_TYPES if lower_type in t.lower() or t.lower() in lower_type]
+            close = _partial_type_matches(type_val.lower())
             if close:
                 suggestions.append(
                     f"Activity type '{type_val}' may not be valid. "
@@ -248,7 +396,7 @@ def _diagnose_event_error(error: ICUAPIError) -> str:
 
     # Check moving_time is a number
     mt = payload.get("moving_time")
-    if mt is not None and not isinstance(mt, (int, float)):
+    if mt is not None and type(mt) not in _NUMBER_TYPES:
         suggestions.append(
             f"'moving_time' must be an integer (seconds), got {type(mt).__name__}. "
             f"Examples: 3600=1h, 5400=1.5h, 7200=2h."
@@ -256,7 +404,7 @@ def _diagnose_event_error(error: ICUAPIError) -> str:
 
     # Check distance is a number
     dist = payload.get("distance")
-    if dist is not None and not isinstance(dist, (int, float)):
+    if dist is not None and type(dist) not in _NUMBER_TYPES:
         suggestions.append(
             f"'distance' must be a number (meters), got {type(dist).__name__}. "
             f"Examples: 40000=40km, 100000=100km."
@@ -292,7 +440,7 @@ def _diagnose_event_error(error: ICUAPIError) -> str:
             "The Intervals.icu API rejected this request. Check that all field "
             "names and values match the expected format.",
             f"Required fields: start_date_local (YYYY-MM-DD), name (string), "
-            f"category ({', '.join(VALID_CATEGORIES[:5])}...).",
+            f"category ({_VALID_CATEGORIES_SAMPLE_STR}...).",
             "Optional fields: type (Ride/Run/Swim), moving_time (seconds), "
             "distance (meters), description (string), workout_doc (object).",
             f"API response: {error.response_text or error.message}",
@@ -310,6 +458,32 @@ def _diagnose_event_error(error: ICUAPIError) -> str:
     )
 
 
+# Planned metrics as (model attribute, output key), only included when set and non-zero
+_EVENT_OPTIONAL_FIELDS = (
+    ("description", "description"),
+    ("type", "type"),
+    ("moving_time", "duration_seconds"),
+    ("distance", "distance_meters"),
+    ("icu_training_load", "training_load"),
+)
+
+
+def _event_to_dict(event: Event) -> dict[str, Any]:
+    """Summarize an API event for tool responses, omitting empty planned metrics."""
+    return {
+        "id": event.id,
+        "start_date": event.start_date_local,
+        "name": event.name,
+        "category": event.category,
+        **{key: value for attr, key in _EVENT_OPTIONAL_FIELDS if (value := getattr(event, attr))},
+    }
+
+
+# 400s are diagnosed against the payload that was sent
+_event_tool_errors = icu_tool_errors(bad_request=_diagnose_event_error)
+
+
+@_event_tool_errors
 async def create_event(
     start_date: Annotated[
         str,
@@ -349,7 +523,7 @@ async def create_event(
         JSON string with created event data
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("client")
 
     # Validate and normalize category (auto-corrects RACE→RACE_A, GOAL→TARGET, etc.)
     try:
@@ -380,62 +554,33 @@ async def create_event(
             error_type="validation_error",
         )
 
-    try:
-        # Build event data
-        event_data: dict[str, Any] = {
-            "start_date_local": start_date_local,
-            "name": name,
-            "category": normalized_category,
-        }
-
-        if description:
-            event_data["description"] = description
-        if normalized_type:
-            event_data["type"] = normalized_type
-        if duration_seconds:
-            event_data["moving_time"] = duration_seconds
-        if distance_meters:
-            event_data["distance"] = distance_meters
-        if training_load:
-            event_data["icu_training_load"] = training_load
-
-        async with ICUClient(config) as client:
-            event = await client.create_event(event_data)
-
-            event_result: dict[str, Any] = {
-                "id": event.id,
-                "start_date": event.start_date_local,
-                "name": event.name,
-                "category": event.category,
-            }
-
-            if event.description:
-                event_result["description"] = event.description
-            if event.type:
-                event_result["type"] = event.type
-            if event.moving_time:
-                event_result["duration_seconds"] = event.moving_time
-            if event.distance:
-                event_result["distance_meters"] = event.distance
-            if event.icu_training_load:
-                event_result["training_load"] = event.icu_training_load
-
-            return ResponseBuilder.build_response(
-                data=event_result,
-                query_type="create_event",
-                metadata={"message": f"Successfully created {category.lower()}: {name}"},
-            )
+    # Build event data (optional fields only when set)
+    optional_fields = (
+        ("description", description),
+        ("type", normalized_type),
+        ("moving_time", duration_seconds),
+        ("distance", distance_meters),
+        ("icu_training_load", training_load),
+    )
+    event_data: dict[str, Any] = {
+        "start_date_local": start_date_local,
+        "name": name,
+        "category": normalized_category,
+        **{key: value for key, value in optional_fields if value},
+    }
 
-    except ICUAPIError as e:
-        if e.status_code == 400:
-            return _diagnose_event_error(e)
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(
-            f"Unexpected error: {str(e)}", error_type="internal_error"
-        )
+    event = await client.create_event(event_data)
+
+    event_result = _event_to_dict(event)
+
+    return ResponseBuilder.build_response(
+        data=event_result,
+        query_type="create_event",
+        metadata={"message": f"Successfully created {category.lower()}: {name}"},
+    )
 
 
+@_event_tool_errors
 async def update_event(
     event_id: Annotated[int, "Event ID to update"],
     name: Annotated[str | None, "Updated event name"] = None,
@@ -469,7 +614,7 @@ async def update_event(
         JSON string with updated event data
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("client")
 
     # Validate and parse date format if provided
     start_date_local = None
@@ -482,68 +627,38 @@ async def update_event(
                 error_type="validation_error",
             )
 
-    try:
-        # Build update data (only include provided fields)
-        event_data: dict[str, Any] = {}
-
-        if name is not None:
-            event_data["name"] = name
-        if description is not None:
-            event_data["description"] = description
-        if start_date_local is not None:
-            event_data["start_date_local"] = start_date_local
-        if event_type is not None:
-            event_data["type"] = event_type
-        if duration_seconds is not None:
-            event_data["moving_time"] = duration_seconds
-        if distance_meters is not None:
-            event_data["distance"] = distance_meters
-        if training_load is not None:
-            event_data["icu_training_load"] = training_load
-
-        if not event_data:
-            return ResponseBuilder.build_error_response(
-                "No fields provided to update. Please specify at least one field to change.",
-                error_type="validation_error",
-            )
-
-        async with ICUClient(config) as client:
-            event = await client.update_event(event_id, event_data)
-
-            event_result: dict[str, Any] = {
-                "id": event.id,
-                "start_date": event.start_date_local,
-                "name": event.name,
-                "category": event.category,
-            }
-
-            if event.description:
-                event_result["description"] = event.description
-            if event.type:
-                event_result["type"] = event.type
-            if event.moving_time:
-                event_result["duration_seconds"] = event.moving_time
-            if event.distance:
-                event_result["distance_meters"] = event.distance
-            if event.icu_training_load:
-                event_result["training_load"] = event.icu_training_load
-
-            return ResponseBuilder.build_response(
-                data=event_result,
-                query_type="update_event",
-                metadata={"message": f"Successfully updated event {event_id}"},
-            )
+    # Build update data (only include provided fields)
+    update_fields = (
+        ("name", name),
+        ("description", description),
+        ("start_date_local", start_date_local),
+        ("type", event_type),
+        ("moving_time", duration_seconds),
+        ("distance", distance_meters),
+        ("icu_training_load", training_load),
+    )
+    event_data: dict[str, Any] = {
+        key: value for key, value in update_fields if value is not None
+    }
 
-    except ICUAPIError as e:
-        if e.status_code == 400:
-            return _diagnose_event_error(e)
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
+    if not event_data:
         return ResponseBuilder.build_error_response(
-            f"Unexpected error: {str(e)}", error_type="internal_error"
+            "No fields provided to update. Please specify at least one field to change.",
+            error_type="validation_error",
         )
 
+    event = await client.update_event(event_id, event_data)
 
+    event_result = _event_to_dict(event)
+
+    return ResponseBuilder.build_response(
+        data=event_result,
+        query_type="update_event",
+        metadata={"message": f"Successfully updated event {event_id}"},
+    )
+
+
+@_event_tool_errors
 async def delete_event(
     event_id: Annotated[int, "Event ID to delete"],
     ctx: Context | None = None,
@@ -559,34 +674,24 @@ async def delete_event(
         JSON string with deletion confirmation
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("client")
 
-    try:
-        async with ICUClient(config) as client:
-            success = await client.delete_event(event_id)
-
-            if success:
-                return ResponseBuilder.build_response(
-                    data={"event_id": event_id, "deleted": True},
-                    query_type="delete_event",
-                    metadata={"message": f"Successfully deleted event {event_id}"},
-                )
-            else:
-                return ResponseBuilder.build_error_response(
-                    f"Failed to delete event {event_id}",
-                    error_type="api_error",
-                )
+    success = await client.delete_event(event_id)
 
-    except ICUAPIError as e:
-        if e.status_code == 400:
-            return _diagnose_event_error(e)
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
+    if success:
+        return ResponseBuilder.build_response(
+            data={"event_id": event_id, "deleted": True},
+            query_type="delete_event",
+            metadata={"message": f"Successfully deleted event {event_id}"},
+        )
+    else:
         return ResponseBuilder.build_error_response(
-            f"Unexpected error: {str(e)}", error_type="internal_error"
+            f"Failed to delete event {event_id}",
+            error_type="api_error",
         )
 
 
+@_event_tool_errors
 async def bulk_create_events(
     events: Annotated[
         str,
@@ -606,120 +711,91 @@ async def bulk_create_events(
         JSON string with created events
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("client")
 
+    # Parse the JSON string
     try:
-        import json
+        parsed_data = _loads(events)
+    except json.JSONDecodeError as e:
+        return ResponseBuilder.build_error_response(
+            f"Invalid JSON format: {str(e)}", error_type="validation_error"
+        )
 
-        # Parse the JSON string
-        try:
-            parsed_data = json.loads(events)
-        except json.JSONDecodeError as e:
+    if not isinstance(parsed_data, list):
+        return ResponseBuilder.build_error_response(
+            "Events must be a JSON array", error_type="validation_error"
+        )
+
+    if not all(isinstance(event, dict) for event in cast(list[Any], parsed_data)):
+        return ResponseBuilder.build_error_response(
+            "Each event must be a JSON object", error_type="validation_error"
+        )
+
+    # Type cast after validation
+    events_data: list[dict[str, Any]] = parsed_data  # type: ignore[assignment]
+
+    # Validate each event
+    for i, event_data in enumerate(events_data):
+        missing = _REQUIRED_EVENT_FIELDS_SET - event_data.keys()
+        if missing:
+            field = next(f for f in _REQUIRED_EVENT_FIELDS if f in missing)
             return ResponseBuilder.build_error_response(
-                f"Invalid JSON format: {str(e)}", error_type="validation_error"
+                f"Event {i}: Missing required field '{field}'",
+                error_type="validation_error",
             )
-
-        if not isinstance(parsed_data, list):
+        try:
+            event_data["category"] = _normalize_category(event_data["category"])
+        except ValueError as e:
             return ResponseBuilder.build_error_response(
-                "Events must be a JSON array", error_type="validation_error"
+                f"Event {i}: {e}",
+                error_type="validation_error",
             )
 
-        # Type cast after validation
-        events_data: list[dict[str, Any]] = parsed_data  # type: ignore[assignment]
+        # Auto-correct common field name mistakes. Most events use no aliases,
+        # so only walk the alias table (in its priority order) when one is present
+        aliased = _FIELD_ALIASES_KEYS & event_data.keys()
+        if aliased:
+            for wrong_name, correct_name in _FIELD_ALIASES.items():
+                if wrong_name in aliased and correct_name not in event_data:
+                    event_data[correct_name] = event_data.pop(wrong_name)
 
-        # Validate each event
-        for i, event_data in enumerate(events_data):
-            if "start_date_local" not in event_data:
-                return ResponseBuilder.build_error_response(
-                    f"Event {i}: Missing required field 'start_date_local'",
-                    error_type="validation_error",
-                )
-            if "name" not in event_data:
-                return ResponseBuilder.build_error_response(
-                    f"Event {i}: Missing required field 'name'", error_type="validation_error"
-                )
-            if "category" not in event_data:
-                return ResponseBuilder.build_error_response(
-                    f"Event {i}: Missing required field 'category'",
-                    error_type="validation_error",
-                )
+        # Validate and normalize event type
+        if "type" in event_data:
             try:
-                event_data["category"] = _normalize_category(event_data["category"])
+                event_data["type"] = _normalize_event_type(event_data["type"])
             except ValueError as e:
                 return ResponseBuilder.build_error_response(
                     f"Event {i}: {e}",
                     error_type="validation_error",
                 )
 
-            # Auto-correct common field name mistakes
-            for wrong_name, correct_name in _FIELD_ALIASES.items():
-                if wrong_name in event_data and correct_name not in event_data:
-                    event_data[correct_name] = event_data.pop(wrong_name)
+        # Validate and normalize the date the same way create_event does
+        try:
+            event_data["start_date_local"] = parse_start_date_local(
+                event_data["start_date_local"]
+            )
+        except ValueError:
+            return ResponseBuilder.build_error_response(
+                f"Event {i}: Invalid date format '{event_data['start_date_local']}'. "
+                f"Use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS (e.g., '2026-03-01').",
+                error_type="validation_error",
+            )
 
-            # Validate and normalize event type
-            if "type" in event_data:
-                try:
-                    event_data["type"] = _normalize_event_type(event_data["type"])
-                except ValueError as e:
-                    return ResponseBuilder.build_error_response(
-                        f"Event {i}: {e}",
-                        error_type="validation_error",
-                    )
-
-            # Validate date format
-            try:
-                datetime.strptime(event_data["start_date_local"], "%Y-%m-%d")
-            except ValueError:
-                return ResponseBuilder.build_error_response(
-                    f"Event {i}: Invalid date format '{event_data['start_date_local']}'. "
-                    f"Use YYYY-MM-DD format (e.g., '2026-03-01').",
-                    error_type="validation_error",
-                )
+    created_events = await client.bulk_create_events(events_data)
 
-        async with ICUClient(config) as client:
-            created_events = await client.bulk_create_events(events_data)
-
-            events_result: list[dict[str, Any]] = []
-            for event in created_events:
-                event_info: dict[str, Any] = {
-                    "id": event.id,
-                    "start_date": event.start_date_local,
-                    "name": event.name,
-                    "category": event.category,
-                }
-
-                if event.description:
-                    event_info["description"] = event.description
-                if event.type:
-                    event_info["type"] = event.type
-                if event.moving_time:
-                    event_info["duration_seconds"] = event.moving_time
-                if event.distance:
-                    event_info["distance_meters"] = event.distance
-                if event.icu_training_load:
-                    event_info["training_load"] = event.icu_training_load
-
-                events_result.append(event_info)
-
-            return ResponseBuilder.build_response(
-                data={"events": events_result},
-                query_type="bulk_create_events",
-                metadata={
-                    "message": f"Successfully created {len(created_events)} events",
-                    "count": len(created_events),
-                },
-            )
+    events_result = [_event_to_dict(event) for event in created_events]
 
-    except ICUAPIError as e:
-        if e.status_code == 400:
-            return _diagnose_event_error(e)
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(
-            f"Unexpected error: {str(e)}", error_type="internal_error"
-        )
+    return ResponseBuilder.build_response(
+        data={"events": events_result},
+        query_type="bulk_create_events",
+        metadata={
+            "message": f"Successfully created {len(created_events)} events",
+            "count": len(created_events),
+        },
+    )
 
 
+@_event_tool_errors
 async def bulk_delete_events(
     event_ids: Annotated[str, "JSON array of event IDs to delete (e.g., '[123, 456, 789]')"],
     ctx: Context | None = None,
@@ -736,51 +812,39 @@ async def bulk_delete_events(
         JSON string with deletion confirmation
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("client")
 
+    # Parse the JSON string
     try:
-        import json
-
-        # Parse the JSON string
-        try:
-            parsed_data = json.loads(event_ids)
-        except json.JSONDecodeError as e:
-            return ResponseBuilder.build_error_response(
-                f"Invalid JSON format: {str(e)}", error_type="validation_error"
-            )
-
-        if not isinstance(parsed_data, list):
-            return ResponseBuilder.build_error_response(
-                "Event IDs must be a JSON array", error_type="validation_error"
-            )
+        parsed_data = _loads(event_ids)
+    except json.JSONDecodeError as e:
+        return ResponseBuilder.build_error_response(
+            f"Invalid JSON format: {str(e)}", error_type="validation_error"
+        )
 
-        if not parsed_data:
-            return ResponseBuilder.build_error_response(
-                "Must provide at least one event ID to delete", error_type="validation_error"
-            )
+    if not isinstance(parsed_data, list):
+        return ResponseBuilder.build_error_response(
+            "Event IDs must be a JSON array", error_type="validation_error"
+        )
 
-        # Type cast after validation
-        ids_list: list[int] = parsed_data  # type: ignore[assignment]
+    if not parsed_data:
+        return ResponseBuilder.build_error_response(
+            "Must provide at least one event ID to delete", error_type="validation_error"
+        )
 
-        async with ICUClient(config) as client:
-            result = await client.bulk_delete_events(ids_list)
+    # Type cast after validation
+    ids_list: list[int] = parsed_data  # type: ignore[assignment]
 
-            return ResponseBuilder.build_response(
-                data={"deleted_count": len(ids_list), "event_ids": ids_list, "result": result},
-                query_type="bulk_delete_events",
-                metadata={"message": f"Successfully deleted {len(ids_list)} events"},
-            )
+    result = await client.bulk_delete_events(ids_list)
 
-    except ICUAPIError as e:
-        if e.status_code == 400:
-            return _diagnose_event_error(e)
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(
-            f"Unexpected error: {str(e)}", error_type="internal_error"
-        )
+    return ResponseBuilder.build_response(
+        data={"deleted_count": len(ids_list), "event_ids": ids_list, "result": result},
+        query_type="bulk_delete_events",
+        metadata={"message": f"Successfully deleted {len(ids_list)} events"},
+    )
 
 
+@_event_tool_errors
 async def mark_event_done(
     event_id: Annotated[int, "Event ID to mark as done"],
     ctx: Context | None = None,
@@ -797,28 +861,18 @@ async def mark_event_done(
         JSON string with confirmation and created activity data
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("client")
 
-    try:
-        async with ICUClient(config) as client:
-            result = await client.mark_event_done(event_id)
-
-            return ResponseBuilder.build_response(
-                data=result,
-                query_type="mark_event_done",
-                metadata={"message": f"Successfully marked event {event_id} as done"},
-            )
+    result = await client.mark_event_done(event_id)
 
-    except ICUAPIError as e:
-        if e.status_code == 400:
-            return _diagnose_event_error(e)
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(
-            f"Unexpected error: {str(e)}", error_type="internal_error"
-        )
+    return ResponseBuilder.build_response(
+        data=result,
+        query_type="mark_event_done",
+        metadata={"message": f"Successfully marked event {event_id} as done"},
+    )
 
 
+@_event_tool_errors
 async def duplicate_event(
     event_id: Annotated[int, "Event ID to duplicate"],
     new_date: Annotated[str, "New date for the duplicated event (YYYY-MM-DD format)"],
@@ -837,54 +891,25 @@ async def duplicate_event(
         JSON string with the duplicated event
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("client")
 
     # Validate date format
-    try:
-        datetime.strptime(new_date, "%Y-%m-%d")
-    except ValueError:
+    if not _is_valid_date(new_date):
         return ResponseBuilder.build_error_response(
             "Invalid date format. Please use YYYY-MM-DD format.",
             error_type="validation_error",
         )
 
-    try:
-        async with ICUClient(config) as client:
-            duplicated_event = await client.duplicate_event(event_id, new_date)
-
-            event_result: dict[str, Any] = {
-                "id": duplicated_event.id,
-                "start_date": duplicated_event.start_date_local,
-                "name": duplicated_event.name,
-                "category": duplicated_event.category,
-                "original_event_id": event_id,
-            }
-
-            if duplicated_event.description:
-                event_result["description"] = duplicated_event.description
-            if duplicated_event.type:
-                event_result["type"] = duplicated_event.type
-            if duplicated_event.moving_time:
-                event_result["duration_seconds"] = duplicated_event.moving_time
-            if duplicated_event.distance:
-                event_result["distance_meters"] = duplicated_event.distance
-            if duplicated_event.icu_training_load:
-                event_result["training_load"] = duplicated_event.icu_training_load
-
-            return ResponseBuilder.build_response(
-                data=event_result,
-                query_type="duplicate_event",
-                metadata={
-                    "message": f"Successfully duplicated event {event_id} to {new_date}",
-                    "original_event_id": event_id,
-                },
-            )
+    duplicated_event = await client.duplicate_event(event_id, new_date)
 
-    except ICUAPIError as e:
-        if e.status_code == 400:
-            return _diagnose_event_error(e)
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(
-            f"Unexpected error: {str(e)}", error_type="internal_error"
-        )
+    event_result = _event_to_dict(duplicated_event)
+    event_result["original_event_id"] = event_id
+
+    return ResponseBuilder.build_response(
+        data=event_result,
+        query_type="duplicate_event",
+        metadata={
+            "message": f"Successfully duplicated event {event_id} to {new_date}",
+            "original_event_id": event_id,
+        },
+    )
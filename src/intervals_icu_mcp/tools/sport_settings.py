@@ -1,14 +1,75 @@
 """Sport-specific settings tools for FTP, FTHR, pace thresholds, and zones."""
 
-from typing import Annotated, Any
+import json
+import math
+import time
+from typing import Annotated, Any, cast
 
 from fastmcp import Context
 
-from ..auth import load_config, validate_credentials
-from ..client import ICUAPIError, ICUClient
+from ..client import ICUClient
+from ..models import SportSettings
 from ..response_builder import ResponseBuilder
+from .errors import icu_tool_errors
 
+# Threshold fields a sport settings update may change
+_UPDATABLE_FIELDS = ("ftp", "fthr", "pace_threshold", "swim_threshold")
 
+# Recent get_sport_settings responses by athlete ID, as (monotonic time, response).
+# Settings rarely change, and the write tools below drop the entry when they do.
+_SETTINGS_CACHE_TTL = 30.0
+_settings_cache: dict[str, tuple[float, str]] = {}
+
+# Count of completed writes by athlete ID, so a read that overlapped a write is not cached
+_settings_generation: dict[str, int] = {}
+
+
+def _invalidate_settings_cache(client: ICUClient) -> None:
+    """Drop the cached get_sport_settings response once a write for the client's athlete ends."""
+    athlete_id = client.config.intervals_icu_athlete_id
+    _settings_cache.pop(athlete_id, None)
+    _settings_generation[athlete_id] = _settings_generation.get(athlete_id, 0) + 1
+
+
+def _format_pace(threshold: float, unit: str) -> str:
+    """Format a threshold in minutes per unit as min:sec (e.g., 4.5 -> "4:30 /km")."""
+    # Flooring to whole seconds first keeps the truncating behavior of float
+    # // and %, while the int divmod and format need no further int() calls
+    minutes, seconds = divmod(math.floor(threshold * 60), 60)
+    return f"{minutes}:{seconds:02d} {unit}"
+
+
+def _settings_to_dict(settings: SportSettings) -> dict[str, Any]:
+    """Summarize sport settings, omitting unset thresholds and formatting paces."""
+    # Each model field is read once into a local
+    ftp, fthr = settings.ftp, settings.fthr
+    pace_threshold, swim_threshold = settings.pace_threshold, settings.swim_threshold
+
+    sport_info: dict[str, Any] = {"id": settings.id, "type": settings.type}
+
+    # Power settings (cycling)
+    if ftp is not None:
+        sport_info["ftp_watts"] = ftp
+
+    # Heart rate settings
+    if fthr is not None:
+        sport_info["fthr_bpm"] = fthr
+
+    # Pace settings (running/swimming), as min:sec per km and per 100m
+    if pace_threshold is not None:
+        sport_info["pace_threshold"] = _format_pace(pace_threshold, "/km")
+    if swim_threshold is not None:
+        sport_info["swim_threshold"] = _format_pace(swim_threshold, "/100m")
+
+    return sport_info
+
+
+_settings_tool_errors = icu_tool_errors(
+    unexpected_error_type="unexpected_error", unexpected_prefix=""
+)
+
+
+@_settings_tool_errors
 async def get_sport_settings(
     ctx: Context | None = None,
 ) -> str:
@@ -17,65 +78,36 @@ async def get_sport_settings(
     Returns:
         Formatted list of sport settings with thresholds and zones
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("client")
 
-    try:
-        async with ICUClient(config) as client:
-            settings_list = await client.get_sport_settings()
-
-            if not settings_list:
-                return ResponseBuilder.build_response(
-                    {"message": "No sport settings found"}, metadata={"count": 0}
-                )
-
-            settings_data: list[dict[str, Any]] = []
-
-            for settings in settings_list:
-                sport_info: dict[str, Any] = {
-                    "id": settings.id,
-                    "type": settings.type,
-                }
-
-                # Power settings (cycling)
-                if settings.ftp is not None:
-                    sport_info["ftp_watts"] = settings.ftp
-
-                # Heart rate settings
-                if settings.fthr is not None:
-                    sport_info["fthr_bpm"] = settings.fthr
-
-                # Pace settings (running/swimming)
-                if settings.pace_threshold is not None:
-                    # Convert to min:sec per km
-                    pace_secs = settings.pace_threshold * 60
-                    minutes = int(pace_secs // 60)
-                    seconds = int(pace_secs % 60)
-                    sport_info["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
-
-                if settings.swim_threshold is not None:
-                    # Convert to min:sec per 100m
-                    swim_secs = settings.swim_threshold * 60
-                    minutes = int(swim_secs // 60)
-                    seconds = int(swim_secs % 60)
-                    sport_info["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
-
-                settings_data.append(sport_info)
-
-            return ResponseBuilder.build_response(
-                {"sport_settings": settings_data},
-                metadata={"count": len(settings_list), "type": "sport_settings_list"},
-            )
+    athlete_id = client.config.intervals_icu_athlete_id
+    now = time.monotonic()
+    cached = _settings_cache.get(athlete_id)
+    if cached is not None and now - cached[0] < _SETTINGS_CACHE_TTL:
+        return cached[1]
+
+    generation = _settings_generation.get(athlete_id, 0)
+    settings_list = await client.get_sport_settings()
+
+    if not settings_list:
+        response = ResponseBuilder.build_response(
+            {"message": "No sport settings found"}, metadata={"count": 0}
+        )
+    else:
+        settings_data = [_settings_to_dict(settings) for settings in settings_list]
+        response = ResponseBuilder.build_response(
+            {"sport_settings": settings_data},
+            metadata={"count": len(settings_list), "type": "sport_settings_list"},
+        )
 
-    except ICUAPIError as e:
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(str(e), error_type="unexpected_error")
+    # A write that finished while this read was in flight may have made it stale
+    if _settings_generation.get(athlete_id, 0) == generation:
+        _settings_cache[athlete_id] = (now, response)
+    return response
 
 
+@_settings_tool_errors
 async def update_sport_settings(
     sport_id: Annotated[int, "ID of the sport settings to update"],
     ftp: Annotated[int | None, "Functional Threshold Power in watts (for cycling)"] = None,
@@ -100,66 +132,123 @@ async def update_sport_settings(
     Returns:
         Updated sport settings
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("client")
+
+    settings_data: dict[str, Any] = {}
+
+    if ftp is not None:
+        settings_data["ftp"] = ftp
+    if fthr is not None:
+        settings_data["fthr"] = fthr
+    if pace_threshold is not None:
+        settings_data["pace_threshold"] = pace_threshold
+    if swim_threshold is not None:
+        settings_data["swim_threshold"] = swim_threshold
+
+    if not settings_data:
+        return ResponseBuilder.build_error_response(
+            "No fields provided to update", error_type="validation_error"
         )
 
     try:
-        async with ICUClient(config) as client:
-            settings_data: dict[str, Any] = {}
-
-            if ftp is not None:
-                settings_data["ftp"] = ftp
-            if fthr is not None:
-                settings_data["fthr"] = fthr
-            if pace_threshold is not None:
-                settings_data["pace_threshold"] = pace_threshold
-            if swim_threshold is not None:
-                settings_data["swim_threshold"] = swim_threshold
-
-            if not settings_data:
-                return ResponseBuilder.build_error_response(
-                    "No fields provided to update", error_type="validation_error"
-                )
-
-            settings = await client.update_sport_settings(sport_id, settings_data)
-
-            result: dict[str, Any] = {
-                "id": settings.id,
-                "type": settings.type,
-            }
-
-            if settings.ftp is not None:
-                result["ftp_watts"] = settings.ftp
-            if settings.fthr is not None:
-                result["fthr_bpm"] = settings.fthr
-            if settings.pace_threshold is not None:
-                pace_secs = settings.pace_threshold * 60
-                minutes = int(pace_secs // 60)
-                seconds = int(pace_secs % 60)
-                result["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
-            if settings.swim_threshold is not None:
-                swim_secs = settings.swim_threshold * 60
-                minutes = int(swim_secs // 60)
-                seconds = int(swim_secs % 60)
-                result["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
-
-            return ResponseBuilder.build_response(
-                result,
-                metadata={
-                    "type": "sport_settings_updated",
-                    "message": "Sport settings updated successfully",
-                },
+        settings = await client.update_sport_settings(sport_id, settings_data)
+    finally:
+        _invalidate_settings_cache(client)
+
+    return ResponseBuilder.build_response(
+        _settings_to_dict(settings),
+        metadata={
+            "type": "sport_settings_updated",
+            "message": "Sport settings updated successfully",
+        },
+    )
+
+
+@_settings_tool_errors
+async def bulk_update_sport_settings(
+    updates: Annotated[
+        str,
+        "JSON array of updates. Each needs the sport settings 'id' plus any of: "
+        "ftp, fthr, pace_threshold (min/km), swim_threshold (min/100m)",
+    ],
+    ctx: Context | None = None,
+) -> str:
+    """Update several sport settings (e.g., FTP for Ride and FTHR for Run) at once.
+
+    All updates are sent to Intervals.icu in a single request, which is faster
+    than calling update_sport_settings once per sport.
+
+    Args:
+        updates: JSON array of objects, each with the sport settings ID and the
+            thresholds to change
+
+    Returns:
+        Updated sport settings
+    """
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("client")
+
+    try:
+        parsed_data = json.loads(updates)
+    except json.JSONDecodeError as e:
+        return ResponseBuilder.build_error_response(
+            f"Invalid JSON format: {str(e)}", error_type="validation_error"
+        )
+
+    if not isinstance(parsed_data, list) or not parsed_data:
+        return ResponseBuilder.build_error_response(
+            "Updates must be a non-empty JSON array", error_type="validation_error"
+        )
+
+    settings_list: list[dict[str, Any]] = []
+    for i, update in enumerate(cast(list[Any], parsed_data)):
+        if not isinstance(update, dict):
+            return ResponseBuilder.build_error_response(
+                f"Update {i}: must be a JSON object", error_type="validation_error"
+            )
+        update = cast(dict[str, Any], update)
+
+        sport_id = update.get("id")
+        if type(sport_id) is not int:
+            return ResponseBuilder.build_error_response(
+                f"Update {i}: 'id' must be the integer sport settings ID",
+                error_type="validation_error",
+            )
+
+        unknown = update.keys() - {"id", *_UPDATABLE_FIELDS}
+        if unknown:
+            return ResponseBuilder.build_error_response(
+                f"Update {i}: unknown field(s) {', '.join(sorted(unknown))}",
+                error_type="validation_error",
+                suggestions=[f"Valid fields: {', '.join(_UPDATABLE_FIELDS)}"],
             )
 
-    except ICUAPIError as e:
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(str(e), error_type="unexpected_error")
+        settings_data = {
+            field: update[field] for field in _UPDATABLE_FIELDS if update.get(field) is not None
+        }
+        if not settings_data:
+            return ResponseBuilder.build_error_response(
+                f"Update {i}: no fields provided to update", error_type="validation_error"
+            )
+        settings_list.append({"id": sport_id, **settings_data})
+
+    try:
+        updated = await client.bulk_update_sport_settings(settings_list)
+    finally:
+        _invalidate_settings_cache(client)
+
+    return ResponseBuilder.build_response(
+        {"sport_settings": [_settings_to_dict(settings) for settings in updated]},
+        metadata={
+            "count": len(updated),
+            "type": "sport_settings_updated",
+            "message": f"Updated {len(updated)} sport settings successfully",
+        },
+    )
 
 
+@_settings_tool_errors
 async def apply_sport_settings(
     sport_id: Annotated[int, "ID of the sport settings to apply"],
     oldest_date: Annotated[
@@ -179,30 +268,21 @@ async def apply_sport_settings(
     Returns:
         Result of applying settings
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("client")
 
-    try:
-        async with ICUClient(config) as client:
-            result = await client.apply_sport_settings(sport_id, oldest=oldest_date)
-
-            return ResponseBuilder.build_response(
-                result,
-                metadata={
-                    "type": "sport_settings_applied",
-                    "message": "Sport settings applied to activities successfully",
-                },
-            )
+    result = await client.apply_sport_settings(sport_id, oldest=oldest_date)
 
-    except ICUAPIError as e:
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(str(e), error_type="unexpected_error")
+    return ResponseBuilder.build_response(
+        result,
+        metadata={
+            "type": "sport_settings_applied",
+            "message": "Sport settings applied to activities successfully",
+        },
+    )
 
 
+@_settings_tool_errors
 async def create_sport_settings(
     sport_type: Annotated[str, "Type of sport (e.g., 'Ride', 'Run', 'Swim')"],
     ftp: Annotated[int | None, "Functional Threshold Power in watts (for cycling)"] = None,
@@ -227,61 +307,35 @@ async def create_sport_settings(
     Returns:
         Created sport settings
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("client")
+
+    settings_data: dict[str, Any] = {"type": sport_type}
+
+    if ftp is not None:
+        settings_data["ftp"] = ftp
+    if fthr is not None:
+        settings_data["fthr"] = fthr
+    if pace_threshold is not None:
+        settings_data["pace_threshold"] = pace_threshold
+    if swim_threshold is not None:
+        settings_data["swim_threshold"] = swim_threshold
 
     try:
-        async with ICUClient(config) as client:
-            settings_data: dict[str, Any] = {"type": sport_type}
-
-            if ftp is not None:
-                settings_data["ftp"] = ftp
-            if fthr is not None:
-                settings_data["fthr"] = fthr
-            if pace_threshold is not None:
-                settings_data["pace_threshold"] = pace_threshold
-            if swim_threshold is not None:
-                settings_data["swim_threshold"] = swim_threshold
-
-            settings = await client.create_sport_settings(settings_data)
-
-            result: dict[str, Any] = {
-                "id": settings.id,
-                "type": settings.type,
-            }
-
-            if settings.ftp is not None:
-                result["ftp_watts"] = settings.ftp
-            if settings.fthr is not None:
-                result["fthr_bpm"] = settings.fthr
-            if settings.pace_threshold is not None:
-                pace_secs = settings.pace_threshold * 60
-                minutes = int(pace_secs // 60)
-                seconds = int(pace_secs % 60)
-                result["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
-            if settings.swim_threshold is not None:
-                swim_secs = settings.swim_threshold * 60
-                minutes = int(swim_secs // 60)
-                seconds = int(swim_secs % 60)
-                result["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
-
-            return ResponseBuilder.build_response(
-                result,
-                metadata={
-                    "type": "sport_settings_created",
-                    "message": "Sport settings created successfully",
-                },
-            )
+        settings = await client.create_sport_settings(settings_data)
+    finally:
+        _invalidate_settings_cache(client)
 
-    except ICUAPIError as e:
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(str(e), error_type="unexpected_error")
+    return ResponseBuilder.build_response(
+        _settings_to_dict(settings),
+        metadata={
+            "type": "sport_settings_created",
+            "message": "Sport settings created successfully",
+        },
+    )
 
 
+@_settings_tool_errors
 async def delete_sport_settings(
     sport_id: Annotated[int, "ID of the sport settings to delete"],
     ctx: Context | None = None,
@@ -294,25 +348,18 @@ async def delete_sport_settings(
     Returns:
         Deletion confirmation
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("client")
 
     try:
-        async with ICUClient(config) as client:
-            await client.delete_sport_settings(sport_id)
-
-            return ResponseBuilder.build_response(
-                {"sport_id": sport_id, "deleted": True},
-                metadata={
-                    "type": "sport_settings_deleted",
-                    "message": "Sport settings deleted successfully",
-                },
-            )
-
-    except ICUAPIError as e:
-        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(str(e), error_type="unexpected_error")
+        await client.delete_sport_settings(sport_id)
+    finally:
+        _invalidate_settings_cache(client)
+
+    return ResponseBuilder.build_response(
+        {"sport_id": sport_id, "deleted": True},
+        metadata={
+            "type": "sport_settings_deleted",
+            "message": "Sport settings deleted successfully",
+        },
+    )
@@ -1,9 +1,12 @@
 """Pytest configuration and shared fixtures."""
 
+from unittest.mock import MagicMock
+
 import pytest
 import respx
 
 from intervals_icu_mcp.auth import ICUConfig
+from intervals_icu_mcp.client import ICUClient
 
 
 @pytest.fixture
@@ -16,13 +19,30 @@ def mock_config():
 
 
 @pytest.fixture
-def respx_mock():
-    """Provide a respx mock router for HTTP requests."""
+async def mock_ctx(mock_config):
+    """Provide a mock context carrying the test config and an open client."""
+    async with ICUClient(mock_config) as client:
+        ctx = MagicMock()
+        ctx.get_state.side_effect = {"config": mock_config, "client": client}.get
+        yield ctx
+
+
+@pytest.fixture(scope="session")
+def respx_router():
+    """Patch httpx once per session with a shared respx mock router."""
     with respx.mock(
         base_url="https://intervals.icu/api/v1",
         assert_all_called=False,
-    ) as respx_mock:
-        yield respx_mock
+    ) as respx_router:
+        yield respx_router
+
+
+@pytest.fixture
+def respx_mock(respx_router):
+    """Provide the respx mock router for HTTP requests, cleared after each test."""
+    yield respx_router
+    respx_router.clear()
+    respx_router.reset()
 
 
 @pytest.fixture
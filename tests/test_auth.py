@@ -0,0 +1,161 @@
+"""Tests for authentication and configuration helpers."""
+
+import os
+import stat
+
+import pytest
+
+from intervals_icu_mcp import auth
+from intervals_icu_mcp.auth import ICUConfig, load_config, reload_config
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache(monkeypatch):
+    """Keep any local .env file out of the tests and drop the cached config afterwards."""
+    monkeypatch.setattr(auth, "load_dotenv", lambda **kwargs: False)
+    yield
+    load_config.cache_clear()
+
+
+class TestLoadConfig:
+    """Tests for load_config caching."""
+
+    def test_load_config_is_cached(self, monkeypatch):
+        """Test that repeated calls return the same cached config."""
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "cached_key")
+        monkeypatch.setenv("INTERVALS_ICU_ATHLETE_ID", "i999")
+        first = reload_config()
+        assert first.intervals_icu_api_key == "cached_key"
+
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "changed_key")
+
+        assert load_config() is first
+        assert load_config().intervals_icu_api_key == "cached_key"
+
+    def test_reload_config_picks_up_changes(self, monkeypatch):
+        """Test that reload_config re-reads the environment."""
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "old_key")
+        reload_config()
+
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "new_key")
+
+        assert reload_config().intervals_icu_api_key == "new_key"
+
+
+class TestICUConfig:
+    """Tests for lazy ICUConfig field resolution."""
+
+    def test_explicit_values_are_used(self, monkeypatch):
+        """Test that constructor values take precedence over the environment."""
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "env_key")
+        config = ICUConfig(intervals_icu_api_key="explicit_key")
+
+        assert config.intervals_icu_api_key == "explicit_key"
+
+    def test_fields_resolve_from_environment_on_access(self, monkeypatch):
+        """Test that omitted fields are read from the environment when first accessed."""
+        monkeypatch.setenv("INTERVALS_ICU_ATHLETE_ID", "i111")
+        config = ICUConfig()
+
+        assert config.intervals_icu_athlete_id == "i111"
+
+        monkeypatch.setenv("INTERVALS_ICU_ATHLETE_ID", "i222")
+        assert config.intervals_icu_athlete_id == "i111"
+
+    def test_config_is_immutable(self):
+        """Test that fields cannot be reassigned."""
+        config = ICUConfig(intervals_icu_api_key="key")
+
+        with pytest.raises(AttributeError):
+            config.intervals_icu_api_key = "other"  # type: ignore[misc]
+
+
+class TestLoadEnvFile:
+    """Tests for the one-shot .env loader."""
+
+    def test_env_file_read_once_unless_overridden(self, monkeypatch):
+        """Test that .env is parsed once, and again only on override."""
+        calls: list[bool] = []
+        monkeypatch.setattr(auth, "load_dotenv", lambda override: calls.append(override))
+        monkeypatch.setattr(auth, "_dotenv_loaded", False)
+
+        auth.load_env_file()
+        auth.load_env_file()
+        auth.load_env_file(override=True)
+
+        assert calls == [False, True]
+
+
+class TestUpdateEnvKey:
+    """Tests for writing credentials to .env."""
+
+    def test_updates_existing_and_appends_missing_keys(self, tmp_path, monkeypatch):
+        """Test that both credentials are written while other lines are preserved."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "")
+        monkeypatch.setenv("INTERVALS_ICU_ATHLETE_ID", "")
+        env_path = tmp_path / ".env"
+        env_path.write_text("# Credentials\nINTERVALS_ICU_API_KEY=old_key\nOTHER=1\n")
+
+        auth.update_env_key("new_key", "i42")
+
+        assert env_path.read_text() == (
+            "# Credentials\n"
+            "INTERVALS_ICU_API_KEY='new_key'\n"
+            "OTHER=1\n"
+            "INTERVALS_ICU_ATHLETE_ID='i42'\n"
+        )
+        assert os.environ["INTERVALS_ICU_API_KEY"] == "new_key"
+        assert os.environ["INTERVALS_ICU_ATHLETE_ID"] == "i42"
+        assert [p.name for p in tmp_path.iterdir()] == [".env"]
+
+    def test_creates_env_file(self, tmp_path, monkeypatch):
+        """Test that a missing .env file is created."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "")
+
+        auth.update_env_key("key_only")
+
+        assert (tmp_path / ".env").read_text() == "INTERVALS_ICU_API_KEY='key_only'\n"
+
+    def test_new_env_file_is_owner_only(self, tmp_path, monkeypatch):
+        """Test that a newly created .env file is not readable by other users."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "")
+        old_umask = os.umask(0o022)
+        try:
+            auth.update_env_key("key_only")
+        finally:
+            os.umask(old_umask)
+
+        assert stat.S_IMODE((tmp_path / ".env").stat().st_mode) == 0o600
+
+    def test_existing_env_file_mode_preserved(self, tmp_path, monkeypatch):
+        """Test that rewriting .env keeps the file's existing permissions."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "")
+        env_path = tmp_path / ".env"
+        env_path.write_text("INTERVALS_ICU_API_KEY=old_key\n")
+        env_path.chmod(0o640)
+
+        auth.update_env_key("new_key")
+
+        assert stat.S_IMODE(env_path.stat().st_mode) == 0o640
+
+    def test_temp_file_removed_when_replace_fails(self, tmp_path, monkeypatch):
+        """Test that a failed write leaves .env untouched and no temp file behind."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("INTERVALS_ICU_API_KEY", "")
+        env_path = tmp_path / ".env"
+        env_path.write_text("INTERVALS_ICU_API_KEY=old_key\n")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(auth.os, "replace", fail_replace)
+
+        with pytest.raises(OSError, match="disk full"):
+            auth.update_env_key("new_key")
+
+        assert env_path.read_text() == "INTERVALS_ICU_API_KEY=old_key\n"
+        assert [p.name for p in tmp_path.iterdir()] == [".env"]
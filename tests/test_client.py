@@ -0,0 +1,148 @@
+"""Tests for the Intervals.icu API client."""
+
+import asyncio
+
+import httpx
+import pytest
+from httpx import Response
+
+from intervals_icu_mcp import client as client_module
+from intervals_icu_mcp.auth import ICUConfig
+from intervals_icu_mcp.client import ICUAPIError, ICUClient, close_clients, get_client
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+class TestSharedClients:
+    """Tests for get_client and close_clients."""
+
+    async def test_client_reused_across_calls(self, mock_config, respx_mock):
+        """Test that the same open client is returned for the same credentials."""
+        respx_mock.get("/athlete/i123456").mock(
+            return_value=Response(200, json={"id": "i123456", "name": "Test Athlete"})
+        )
+        client = get_client(mock_config)
+        try:
+            await client.get_athlete()
+            assert get_client(mock_config) is client
+            assert (
+                get_client(ICUConfig(intervals_icu_api_key="other", intervals_icu_athlete_id="i1"))
+                is not client
+            )
+        finally:
+            await close_clients()
+
+    async def test_close_clients(self, mock_config):
+        """Test that closed clients are dropped and replaced on the next call."""
+        client = get_client(mock_config)
+        await close_clients()
+
+        assert client._client is None
+        assert get_client(mock_config) is not client
+        await close_clients()
+
+
+class TestRetries:
+    """Tests for retrying rate-limited and unavailable responses."""
+
+    async def test_retry_after_honored(self, mock_config, respx_mock, sleeps):
+        """Test that a 429 is retried after the server's Retry-After delay."""
+        route = respx_mock.get("/athlete/i123456").mock(
+            side_effect=[
+                Response(429, headers={"Retry-After": "2"}),
+                Response(503),
+                Response(200, json={"id": "i123456", "name": "Test Athlete"}),
+            ]
+        )
+
+        async with ICUClient(mock_config) as client:
+            athlete = await client.get_athlete()
+
+        assert athlete.name == "Test Athlete"
+        assert route.call_count == 3
+        assert sleeps == [2.0, 1.0]
+
+    async def test_gives_up_after_max_retries(self, mock_config, respx_mock, sleeps):
+        """Test that persistent rate limiting is still reported as an API error."""
+        route = respx_mock.get("/athlete/i123456").mock(return_value=Response(429))
+
+        async with ICUClient(mock_config) as client:
+            with pytest.raises(ICUAPIError) as exc_info:
+                await client.get_athlete()
+
+        assert exc_info.value.status_code == 429
+        assert route.call_count == ICUClient.MAX_RETRIES + 1
+        assert sleeps == [0.5, 1.0, 2.0]
+
+    async def test_long_retry_after_not_waited(self, mock_config, respx_mock, sleeps):
+        """Test that a Retry-After beyond MAX_RETRY_DELAY fails fast."""
+        route = respx_mock.get("/athlete/i123456").mock(
+            return_value=Response(429, headers={"Retry-After": "3600"})
+        )
+
+        async with ICUClient(mock_config) as client:
+            with pytest.raises(ICUAPIError):
+                await client.get_athlete()
+
+        assert route.call_count == 1
+        assert sleeps == []
+
+
+class TestConcurrencyLimit:
+    """Tests for the per-client request limit."""
+
+    async def test_requests_capped(self, mock_config, respx_mock, monkeypatch):
+        """Test that no more than INTERVALS_ICU_MAX_CONCURRENCY requests run at once."""
+        monkeypatch.setenv("INTERVALS_ICU_MAX_CONCURRENCY", "2")
+        in_flight = peak = 0
+
+        async def respond(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Response(200, json={"id": "i123456", "name": "Test Athlete"})
+
+        respx_mock.get("/athlete/i123456").mock(side_effect=respond)
+
+        async with ICUClient(mock_config) as client:
+            await asyncio.gather(*(client.get_athlete() for _ in range(5)))
+
+        assert peak == 2
+
+    def test_invalid_limit_uses_default(self, mock_config, monkeypatch):
+        """Test that a non-numeric limit falls back to the default."""
+        monkeypatch.setenv("INTERVALS_ICU_MAX_CONCURRENCY", "lots")
+
+        assert ICUClient(mock_config)._max_concurrency == ICUClient.DEFAULT_MAX_CONCURRENCY
+
+
+class TestWarmUp:
+    """Tests for ICUClient.warm_up."""
+
+    async def test_warm_up_requests_athlete(self, mock_config, respx_mock):
+        """Test that warming up sends a HEAD for the configured athlete."""
+        route = respx_mock.head("/athlete/i123456").mock(return_value=Response(200))
+
+        async with ICUClient(mock_config) as client:
+            await client.warm_up()
+
+        assert route.call_count == 1
+
+    async def test_warm_up_failures_ignored(self, mock_config, respx_mock):
+        """Test that a connection failure during warm-up is not raised."""
+        respx_mock.head("/athlete/i123456").mock(side_effect=httpx.ConnectError("offline"))
+
+        async with ICUClient(mock_config) as client:
+            await client.warm_up()
@@ -0,0 +1,366 @@
+"""Tests for event management tools."""
+
+import json
+
+import pytest
+from httpx import Response
+
+from intervals_icu_mcp.client import ICUAPIError
+from intervals_icu_mcp.tools import event_management
+from intervals_icu_mcp.tools.event_management import (
+    _diagnose_event_error,
+    _event_tool_errors,
+    _normalize_category,
+    _normalize_event_type,
+    bulk_create_events,
+    create_event,
+    duplicate_event,
+    parse_start_date_local,
+    update_event,
+)
+
+
+class TestParseStartDateLocal:
+    """Tests for parse_start_date_local."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2025-12-08", "2025-12-08T00:00:00"),
+            ("2025-12-08T15:00", "2025-12-08T15:00:00"),
+            ("2025-12-08T15:04:05", "2025-12-08T15:04:05"),
+            ("2025-1-5", "2025-01-05T00:00:00"),
+            ("2025-12-08T25:00", "2025-12-08T00:00:00"),
+        ],
+    )
+    def test_accepted_formats(self, value, expected):
+        """Test padded, unpadded and date-prefixed inputs."""
+        assert parse_start_date_local(value) == expected
+
+    @pytest.mark.parametrize("value", ["2025-02-30", "12/08/2025", ""])
+    def test_invalid_dates(self, value):
+        """Test that unparseable dates raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid date format"):
+            parse_start_date_local(value)
+
+    def test_repeated_dates_are_cached(self):
+        """Test that a repeated date is answered from the cache."""
+        parse_start_date_local.cache_clear()
+        parse_start_date_local("2025-12-08")
+        parse_start_date_local("2025-12-08")
+        assert parse_start_date_local.cache_info().hits == 1
+
+
+class TestNormalizeCategory:
+    """Tests for _normalize_category."""
+
+    def test_valid_and_aliased_categories(self):
+        """Test that valid categories are uppercased and aliases corrected."""
+        assert _normalize_category("workout") == "WORKOUT"
+        assert _normalize_category("race") == "RACE_A"
+
+    def test_unknown_category_lists_valid_values(self):
+        """Test that the error names every valid category."""
+        with pytest.raises(ValueError, match="Must be one of: WORKOUT, RACE_A, .*SET_FITNESS\\."):
+            _normalize_category("party")
+
+
+class TestNormalizeEventType:
+    """Tests for _normalize_event_type."""
+
+    def test_case_insensitive_exact_match(self):
+        """Test that casing is corrected for known types."""
+        assert _normalize_event_type("ride") == "Ride"
+        assert _normalize_event_type("VIRTUALRIDE") == "VirtualRide"
+
+    def test_unique_partial_match(self):
+        """Test that a unique substring resolves to its type."""
+        assert _normalize_event_type("gravel") == "GravelRide"
+
+    def test_type_name_inside_longer_input(self):
+        """Test that an input containing exactly one type name resolves to it."""
+        assert _normalize_event_type("yoga class") == "Yoga"
+
+    def test_ambiguous_partial_match(self):
+        """Test that a substring shared by several types is rejected."""
+        with pytest.raises(ValueError, match="Ambiguous activity type 'Ski'"):
+            _normalize_event_type("Ski")
+
+    def test_unknown_type(self):
+        """Test that unrelated input is rejected."""
+        with pytest.raises(ValueError, match="Unknown activity type 'Bobsled'"):
+            _normalize_event_type("Bobsled")
+
+
+class TestDiagnoseEventError:
+    """Tests for _diagnose_event_error suggestions."""
+
+    def test_non_object_payload(self):
+        """Test that a non-dict payload gets the fixed JSON-object guidance."""
+        response = json.loads(
+            _diagnose_event_error(ICUAPIError("Bad request", 400, request_payload=[1, 2]))
+        )
+
+        assert response["error"]["type"] == "validation_error"
+        assert "not a list" in response["error"]["message"]
+        assert response["error"]["suggestions"][0] == (
+            "Payload must be a JSON object with string keys."
+        )
+
+    def test_wrong_field_names_reported_in_payload_order(self):
+        """Test that aliased and unknown fields are flagged in the order they were sent."""
+        payload = {
+            "title": "Easy Ride",
+            "start_date_local": "2026-03-01",
+            "colour": "red",
+            "category": "WORKOUT",
+            "duration": 3600,
+        }
+
+        response = json.loads(
+            _diagnose_event_error(ICUAPIError("Bad request", 400, request_payload=payload))
+        )
+
+        suggestions = response["error"]["suggestions"]
+        assert suggestions[0] == "Field 'title' is not a valid API field. Use 'name' instead."
+        assert suggestions[1].startswith("Unknown field 'colour'. Valid fields: ")
+        assert (
+            suggestions[2]
+            == "Field 'duration' is not a valid API field. Use 'moving_time' instead."
+        )
+
+    @pytest.mark.parametrize(
+        ("moving_time", "flagged"), [(3600, False), (3600.0, False), ("1h", True), (True, True)]
+    )
+    def test_moving_time_must_be_number(self, moving_time, flagged):
+        """Test that strings and booleans are rejected as moving_time."""
+        payload = {"start_date_local": "2026-03-01", "name": "Ride", "category": "WORKOUT"}
+        payload["moving_time"] = moving_time
+
+        response = json.loads(
+            _diagnose_event_error(ICUAPIError("Bad request", 400, request_payload=payload))
+        )
+
+        suggestions = response["error"]["suggestions"]
+        assert any(s.startswith("'moving_time' must be") for s in suggestions) is flagged
+
+    @pytest.mark.parametrize(
+        ("date", "flagged"),
+        [("2026-03-01", False), ("2026-3-1T9:05", False), ("2026-03-01T14:00:00Z", True)],
+    )
+    def test_date_format_check(self, date, flagged):
+        """Test which start dates are reported as badly formatted."""
+        payload = {"start_date_local": date, "name": "Ride", "category": "WORKOUT"}
+
+        response = json.loads(
+            _diagnose_event_error(ICUAPIError("Bad request", 400, request_payload=payload))
+        )
+
+        suggestions = response["error"]["suggestions"]
+        assert any("has invalid format" in s for s in suggestions) is flagged
+
+
+class TestBulkCreateEvents:
+    """Tests for bulk_create_events validation."""
+
+    async def test_reports_first_missing_required_field(self, mock_ctx):
+        """Test that missing fields are reported in start_date_local, name, category order."""
+        events = json.dumps([{"start_date_local": "2026-03-01"}])
+
+        response = json.loads(await bulk_create_events(events, ctx=mock_ctx))
+
+        assert response["error"]["message"] == "Event 0: Missing required field 'name'"
+
+    @pytest.mark.parametrize("parser", ["orjson", "stdlib"])
+    async def test_invalid_json(self, mock_ctx, monkeypatch, parser):
+        """Test that malformed JSON is reported with either parser."""
+        if parser == "stdlib":
+            monkeypatch.setattr(event_management, "orjson", None)
+
+        response = json.loads(await bulk_create_events("[{", ctx=mock_ctx))
+
+        assert response["error"]["type"] == "validation_error"
+        assert response["error"]["message"].startswith("Invalid JSON format: ")
+
+    async def test_rejects_non_object_events(self, mock_ctx):
+        """Test that array items must be JSON objects."""
+        response = json.loads(await bulk_create_events('["2026-03-01"]', ctx=mock_ctx))
+
+        assert response["error"]["message"] == "Each event must be a JSON object"
+
+    async def test_field_aliases_corrected(self, mock_ctx, respx_mock):
+        """Test that aliased field names are renamed before the request is sent."""
+        route = respx_mock.post("/athlete/i123456/events/bulk").mock(
+            return_value=Response(200, json=[])
+        )
+        events = json.dumps(
+            [
+                {
+                    "start_date_local": "2026-03-01",
+                    "name": "Easy Ride",
+                    "category": "workout",
+                    "duration": 3600,
+                    "tss": 40,
+                }
+            ]
+        )
+
+        await bulk_create_events(events, ctx=mock_ctx)
+
+        sent = json.loads(route.calls.last.request.content)
+        assert sent == [
+            {
+                "start_date_local": "2026-03-01T00:00:00",
+                "name": "Easy Ride",
+                "category": "WORKOUT",
+                "moving_time": 3600,
+                "icu_training_load": 40,
+            }
+        ]
+
+    async def test_dates_normalized_like_create_event(self, mock_ctx, respx_mock):
+        """Test that date-only and minute-precision dates are sent as full datetimes."""
+        route = respx_mock.post("/athlete/i123456/events/bulk").mock(
+            return_value=Response(200, json=[])
+        )
+        events = json.dumps(
+            [
+                {"start_date_local": "2026-03-01", "name": "Ride", "category": "WORKOUT"},
+                {"start_date_local": "2026-03-02T06:30", "name": "Run", "category": "WORKOUT"},
+            ]
+        )
+
+        await bulk_create_events(events, ctx=mock_ctx)
+
+        sent = json.loads(route.calls.last.request.content)
+        assert [e["start_date_local"] for e in sent] == [
+            "2026-03-01T00:00:00",
+            "2026-03-02T06:30:00",
+        ]
+
+    async def test_invalid_date_rejected(self, mock_ctx):
+        """Test that an unparseable date is reported with its event index."""
+        events = json.dumps(
+            [{"start_date_local": "03/01/2026", "name": "Ride", "category": "WORKOUT"}]
+        )
+
+        response = json.loads(await bulk_create_events(events, ctx=mock_ctx))
+
+        assert response["error"]["message"].startswith("Event 0: Invalid date format '03/01/2026'")
+
+    async def test_events_sent_in_one_batch_request(self, mock_ctx, respx_mock):
+        """Test that all events go to the bulk endpoint in a single request."""
+        bulk_route = respx_mock.post("/athlete/i123456/events/bulk").mock(
+            return_value=Response(200, json=[])
+        )
+        single_route = respx_mock.post("/athlete/i123456/events")
+        events = json.dumps(
+            [
+                {"start_date_local": f"2026-03-0{day}", "name": "Ride", "category": "WORKOUT"}
+                for day in range(1, 6)
+            ]
+        )
+
+        await bulk_create_events(events, ctx=mock_ctx)
+
+        assert bulk_route.call_count == 1
+        assert len(json.loads(bulk_route.calls.last.request.content)) == 5
+        assert not single_route.called
+
+
+class TestCreateEvent:
+    """Tests for create_event."""
+
+    async def test_created_event_summary(self, mock_ctx, respx_mock):
+        """Test that the response summarizes the event and omits empty metrics."""
+        respx_mock.post("/athlete/i123456/events").mock(
+            return_value=Response(
+                200,
+                json={
+                    "id": 42,
+                    "start_date_local": "2026-03-01T00:00:00",
+                    "name": "Easy Ride",
+                    "category": "WORKOUT",
+                    "type": "Ride",
+                    "moving_time": 3600,
+                    "distance": 0,
+                },
+            )
+        )
+
+        result = await create_event("2026-03-01", "Easy Ride", "workout", ctx=mock_ctx)
+
+        assert json.loads(result)["data"] == {
+            "id": 42,
+            "start_date": "2026-03-01T00:00:00",
+            "name": "Easy Ride",
+            "category": "WORKOUT",
+            "type": "Ride",
+            "duration_seconds": 3600,
+        }
+
+
+class TestUpdateEvent:
+    """Tests for update_event."""
+
+    async def test_only_provided_fields_sent(self, mock_ctx, respx_mock):
+        """Test that None fields are omitted while explicit zero values are kept."""
+        route = respx_mock.put("/athlete/i123456/events/42").mock(
+            return_value=Response(
+                200,
+                json={"id": 42, "start_date_local": "2026-03-01T00:00:00", "name": "Rest"},
+            )
+        )
+
+        await update_event(42, name="Rest", duration_seconds=0, ctx=mock_ctx)
+
+        assert json.loads(route.calls.last.request.content) == {"name": "Rest", "moving_time": 0}
+
+    async def test_no_fields_rejected(self, mock_ctx):
+        """Test that an update without fields is a validation error."""
+        response = json.loads(await update_event(42, ctx=mock_ctx))
+
+        assert response["error"]["type"] == "validation_error"
+
+
+class TestDuplicateEvent:
+    """Tests for duplicate_event."""
+
+    @pytest.mark.parametrize("new_date", ["2026-02-30", "2026-03-01T10:00", "03/01/2026"])
+    async def test_invalid_date_rejected(self, mock_ctx, new_date):
+        """Test that anything but a real YYYY-MM-DD date is a validation error."""
+        response = json.loads(await duplicate_event(42, new_date, ctx=mock_ctx))
+
+        assert response["error"]["type"] == "validation_error"
+
+
+class TestEventToolErrors:
+    """Tests for the event-tool exception handlers."""
+
+    @pytest.mark.parametrize(
+        ("exc", "error_type"),
+        [
+            (
+                ICUAPIError("Bad request", 400, request_payload={"name": "Ride"}),
+                "api_validation_error",
+            ),
+            (ICUAPIError("Not found", 404), "api_error"),
+            (RuntimeError("boom"), "internal_error"),
+        ],
+    )
+    async def test_exceptions_mapped_to_error_responses(self, exc, error_type):
+        """Test that each exception kind becomes the matching error response."""
+
+        @_event_tool_errors
+        async def tool() -> str:
+            raise exc
+
+        response = json.loads(await tool())
+
+        assert response["error"]["type"] == error_type
+
+    def test_wrapped_metadata_preserved(self):
+        """Test that the decorator keeps the name and docstring FastMCP registers."""
+        assert create_event.__name__ == "create_event"
+        assert create_event.__doc__ is not None
+        assert create_event.__doc__.startswith("Create a new calendar event")
@@ -0,0 +1,98 @@
+"""Tests for data formatting utilities."""
+
+from datetime import UTC
+
+from intervals_icu_mcp.formatters import (
+    _parse_iso_stdlib,
+    calculate_avg,
+    format_date,
+    format_duration,
+    format_tsb,
+    format_wellness_value,
+)
+
+
+class TestFormatDate:
+    """Tests for format_date."""
+
+    def test_format_date_iso_string(self):
+        """Test formatting a plain ISO date string."""
+        assert format_date("2025-10-13T08:00:00") == "2025-10-13"
+
+    def test_format_date_with_z_suffix(self):
+        """Test that a trailing 'Z' is accepted."""
+        assert format_date("2025-10-13T08:30:00Z", include_time=True) == "2025-10-13 08:30"
+
+    def test_format_date_invalid_string_returned_unchanged(self):
+        """Test that unparseable strings are passed through."""
+        assert format_date("not a date") == "not a date"
+
+    def test_format_date_keeps_local_date_of_offset_strings(self):
+        """Test that the date portion is used as written, without timezone conversion."""
+        assert format_date("2025-10-13T23:30:00-05:00") == "2025-10-13"
+
+    def test_format_date_none(self):
+        """Test that None renders as N/A."""
+        assert format_date(None) == "N/A"
+
+
+class TestParseIsoDatetime:
+    """Tests for the stdlib ISO parser fallback."""
+
+    def test_equal_offsets_share_tzinfo(self):
+        """Test that datetimes with the same offset reuse one tzinfo object."""
+        first = _parse_iso_stdlib("2025-10-13T08:00:00+02:00")
+        second = _parse_iso_stdlib("2025-10-14T09:30:00+02:00")
+
+        assert first.tzinfo is second.tzinfo
+        assert first.isoformat() == "2025-10-13T08:00:00+02:00"
+
+    def test_utc_and_naive_values(self):
+        """Test that UTC and naive strings parse as expected."""
+        assert _parse_iso_stdlib("2025-10-13T08:00:00Z").tzinfo is UTC
+        assert _parse_iso_stdlib("2025-10-13").tzinfo is None
+
+
+class TestStatusFormatters:
+    """Tests for threshold-based status formatters."""
+
+    def test_format_tsb_boundaries(self):
+        """Test that TSB thresholds are exclusive."""
+        assert format_tsb(25) == "+25.0 (Fresh 🟢)"
+        assert format_tsb(20) == "+20.0 (Recovered)"
+        assert format_tsb(5) == "+5.0 (Optimal)"
+        assert format_tsb(-10) == "-10.0 (Fatigued ⚠️)"
+        assert format_tsb(-30) == "-30.0 (Very Fatigued ⚠️)"
+        assert format_tsb(None) == "N/A"
+
+    def test_format_wellness_value_boundaries(self):
+        """Test that wellness thresholds are inclusive."""
+        assert format_wellness_value(8) == "8/10 🟢"
+        assert format_wellness_value(6) == "6/10 🟡"
+        assert format_wellness_value(4) == "4/10"
+        assert format_wellness_value(3) == "3/10 🔴"
+        assert format_wellness_value(4, scale=5) == "4/5 🟢"
+
+
+class TestFormatDuration:
+    """Tests for format_duration."""
+
+    def test_format_duration_omits_zero_components(self):
+        """Test that zero-valued components are left out."""
+        assert format_duration(8130) == "2h 15m 30s"
+        assert format_duration(3605) == "1h 5s"
+        assert format_duration(3660) == "1h 1m"
+        assert format_duration(3600) == "1h"
+        assert format_duration(90) == "1m 30s"
+        assert format_duration(0) == "0s"
+        assert format_duration(None) == "0s"
+
+
+class TestCalculateAvg:
+    """Tests for calculate_avg."""
+
+    def test_calculate_avg(self):
+        """Test averages of ints, floats and an empty list."""
+        assert calculate_avg([1, 2, 3, 4]) == 2.5
+        assert calculate_avg([0.1] * 10) == 0.1
+        assert calculate_avg([]) == 0.0
@@ -0,0 +1,50 @@
+"""Tests for the tool-call middleware."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import dotenv
+import pytest
+from fastmcp.exceptions import ToolError
+
+from intervals_icu_mcp import auth
+from intervals_icu_mcp.auth import load_config
+from intervals_icu_mcp.client import close_clients
+from intervals_icu_mcp.middleware import ConfigMiddleware
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Point .env loading at a temporary file and start from unset credentials."""
+    env_path = tmp_path / ".env"
+    monkeypatch.setattr(
+        auth, "load_dotenv", lambda **kwargs: dotenv.load_dotenv(env_path, **kwargs)
+    )
+    monkeypatch.setattr(auth, "_dotenv_loaded", False)
+    # Set through monkeypatch so values loaded from the file are undone afterwards
+    monkeypatch.setenv("INTERVALS_ICU_API_KEY", "")
+    monkeypatch.setenv("INTERVALS_ICU_ATHLETE_ID", "")
+    load_config.cache_clear()
+    yield env_path
+    load_config.cache_clear()
+
+
+class TestConfigMiddleware:
+    """Tests for ConfigMiddleware."""
+
+    async def test_credentials_written_after_failed_load_are_used(self, env_file):
+        """Test that credentials saved after a rejected call are picked up without a restart."""
+        middleware = ConfigMiddleware()
+        call_next = AsyncMock(return_value="ok")
+        context = MagicMock()
+
+        with pytest.raises(ToolError):
+            await middleware.on_call_tool(context, call_next)
+
+        # As if icu-mcp-auth had been run in another shell
+        env_file.write_text("INTERVALS_ICU_API_KEY='real_key'\nINTERVALS_ICU_ATHLETE_ID='i42'\n")
+
+        assert await middleware.on_call_tool(context, call_next) == "ok"
+        config = context.fastmcp_context.set_state.call_args_list[0].args[1]
+        assert config.intervals_icu_api_key == "real_key"
+        assert config.intervals_icu_athlete_id == "i42"
+        await close_clients()
@@ -0,0 +1,115 @@
+"""Tests for the response builder."""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from intervals_icu_mcp import response_builder
+from intervals_icu_mcp.response_builder import ResponseBuilder
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def serializer(request, monkeypatch):
+    """Run each test with orjson and with the stdlib json fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(response_builder, "orjson", None)
+    return request.param
+
+
+class TestBuildResponse:
+    """Tests for ResponseBuilder.build_response."""
+
+    def test_datetimes_serialized_as_iso(self, serializer):
+        """Test that nested datetimes are emitted as ISO strings."""
+        result = ResponseBuilder.build_response(
+            data={
+                "start": datetime(2025, 10, 13, 8, 0),
+                "events": [{"at": datetime(2025, 10, 14, 9, 30, tzinfo=UTC)}],
+            },
+            analysis={"latest": datetime(2025, 10, 15, 7, 0, 0, 123456)},
+            query_type="test",
+        )
+
+        response = json.loads(result)
+        assert response["data"]["start"] == "2025-10-13T08:00:00"
+        assert response["data"]["events"][0]["at"] == "2025-10-14T09:30:00+00:00"
+        assert response["analysis"]["latest"] == "2025-10-15T07:00:00.123456"
+        assert response["metadata"]["query_type"] == "test"
+        assert "fetched_at" in response["metadata"]
+
+    def test_non_string_keys_coerced(self, serializer):
+        """Test that integer dict keys are emitted as strings."""
+        response = json.loads(ResponseBuilder.build_response(data={"zones": {1: "Z1"}}))
+        assert response["data"]["zones"] == {"1": "Z1"}
+
+    def test_empty_analysis_omitted(self, serializer):
+        """Test that an empty analysis section is not included."""
+        response = json.loads(ResponseBuilder.build_response(data={}, analysis={}))
+        assert "analysis" not in response
+
+    def test_metadata_not_mutated(self, serializer):
+        """Test that the caller's metadata dict is left untouched."""
+        metadata = {"count": 1}
+        ResponseBuilder.build_response(data={}, metadata=metadata, query_type="test")
+        assert metadata == {"count": 1}
+
+
+class TestBuildErrorResponse:
+    """Tests for ResponseBuilder.build_error_response."""
+
+    def test_error_response(self, serializer):
+        """Test error structure with suggestions."""
+        response = json.loads(
+            ResponseBuilder.build_error_response(
+                "Not found", error_type="not_found", suggestions=["Check the ID"]
+            )
+        )
+        assert response["error"]["message"] == "Not found"
+        assert response["error"]["type"] == "not_found"
+        assert response["error"]["suggestions"] == ["Check the ID"]
+        assert "timestamp" in response["error"]
+
+
+class TestNowIso:
+    """Tests for the cached response timestamp."""
+
+    def test_reused_within_same_millisecond(self, monkeypatch):
+        """Test that calls within one millisecond share a timestamp."""
+        times = iter([1_700_000_000.0, 1_700_000_000.0005, 1_700_000_000.002])
+        monkeypatch.setattr(response_builder.time, "time", lambda: next(times))
+        monkeypatch.setattr(response_builder, "_last_ts", (0.0, ""))
+
+        first = response_builder._now_iso()
+        assert response_builder._now_iso() == first
+        assert response_builder._now_iso() != first
+
+    def test_timestamp_is_utc(self, monkeypatch):
+        """Test that generated timestamps carry a UTC offset."""
+        monkeypatch.setattr(response_builder, "_last_ts", (0.0, ""))
+        assert response_builder._now_iso().endswith("+00:00")
+
+
+class TestFormatDateWithDay:
+    """Tests for ResponseBuilder.format_date_with_day."""
+
+    def test_afternoon_datetime_string(self):
+        """Test the full breakdown of an ISO string."""
+        assert ResponseBuilder.format_date_with_day("2025-10-13T14:30:00Z") == {
+            "datetime": "2025-10-13T14:30:00Z",
+            "date": "2025-10-13",
+            "day_of_week": "Monday",
+            "formatted": "Monday, October 13, 2025 at 02:30 PM",
+        }
+
+    def test_midnight_and_noon(self):
+        """Test 12-hour clock edge cases."""
+        midnight = ResponseBuilder.format_date_with_day(datetime(2025, 3, 1, 0, 5))
+        noon = ResponseBuilder.format_date_with_day(datetime(2025, 3, 1, 12, 0))
+        assert midnight is not None and noon is not None
+        assert midnight["formatted"] == "Saturday, March 01, 2025 at 12:05 AM"
+        assert noon["formatted"] == "Saturday, March 01, 2025 at 12:00 PM"
+
+    def test_none(self):
+        """Test that None input returns None."""
+        assert ResponseBuilder.format_date_with_day(None) is None
@@ -0,0 +1,37 @@
+"""Tests for the MCP server setup."""
+
+import asyncio
+
+from intervals_icu_mcp import server
+from intervals_icu_mcp.client import ICUClient
+
+
+class TestLifespan:
+    """Tests for the server lifespan."""
+
+    async def test_warm_up_finished_before_clients_close(self, mock_config, monkeypatch):
+        """Test that a pending warm-up is cancelled and awaited before shared clients close."""
+        events: list[str] = []
+        started = asyncio.Event()
+
+        async def slow_warm_up(self):
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                events.append("warm_up_cancelled")
+                raise
+
+        async def record_close():
+            events.append("clients_closed")
+
+        monkeypatch.setattr(server, "load_config", lambda: mock_config)
+        monkeypatch.setattr(server, "validate_credentials", lambda config: True)
+        monkeypatch.setattr(server, "get_client", ICUClient)
+        monkeypatch.setattr(ICUClient, "warm_up", slow_warm_up)
+        monkeypatch.setattr(server, "close_clients", record_close)
+
+        async with server.lifespan(server.mcp):
+            await started.wait()
+
+        assert events == ["warm_up_cancelled", "clients_closed"]
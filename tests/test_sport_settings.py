@@ -0,0 +1,272 @@
+"""Tests for sport settings tools."""
+
+import asyncio
+import json
+
+import pytest
+from httpx import Response
+
+from intervals_icu_mcp.tools import sport_settings
+from intervals_icu_mcp.tools.sport_settings import (
+    _format_pace,
+    bulk_update_sport_settings,
+    get_sport_settings,
+    update_sport_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Keep cached get_sport_settings responses from leaking between tests."""
+    yield
+    sport_settings._settings_cache.clear()
+    sport_settings._settings_generation.clear()
+
+
+class TestFormatPace:
+    """Tests for _format_pace."""
+
+    @pytest.mark.parametrize(
+        ("threshold", "expected"),
+        [(4.5, "4:30 /km"), (4.0, "4:00 /km"), (4.999, "4:59 /km"), (0.25, "0:15 /km")],
+    )
+    def test_min_sec_truncated(self, threshold, expected):
+        """Test that seconds are truncated rather than rounded."""
+        assert _format_pace(threshold, "/km") == expected
+
+
+class TestGetSportSettings:
+    """Tests for get_sport_settings."""
+
+    async def test_thresholds_formatted(self, mock_ctx, respx_mock):
+        """Test that thresholds are renamed and paces rendered as min:sec."""
+        respx_mock.get("/athlete/i123456/sport-settings").mock(
+            return_value=Response(
+                200,
+                json=[
+                    {"id": 1, "type": "Ride", "ftp": 250, "fthr": 165},
+                    {"id": 2, "type": "Run", "pace_threshold": 4.5},
+                    {"id": 3, "type": "Swim", "swim_threshold": 1.75},
+                ],
+            )
+        )
+
+        response = json.loads(await get_sport_settings(ctx=mock_ctx))
+
+        assert response["data"]["sport_settings"] == [
+            {"id": 1, "type": "Ride", "ftp_watts": 250, "fthr_bpm": 165},
+            {"id": 2, "type": "Run", "pace_threshold": "4:30 /km"},
+            {"id": 3, "type": "Swim", "swim_threshold": "1:45 /100m"},
+        ]
+        assert response["metadata"]["count"] == 3
+
+    async def test_no_settings(self, mock_ctx, respx_mock):
+        """Test the response when the athlete has no sport settings."""
+        respx_mock.get("/athlete/i123456/sport-settings").mock(return_value=Response(200, json=[]))
+
+        response = json.loads(await get_sport_settings(ctx=mock_ctx))
+
+        assert response["data"] == {"message": "No sport settings found"}
+        assert response["metadata"]["count"] == 0
+
+    async def test_api_error_mapped(self, mock_ctx, respx_mock):
+        """Test that API failures become api_error responses."""
+        respx_mock.get("/athlete/i123456/sport-settings").mock(return_value=Response(404))
+
+        response = json.loads(await get_sport_settings(ctx=mock_ctx))
+
+        assert response["error"] == {
+            "message": "Resource not found.",
+            "type": "api_error",
+            "timestamp": response["error"]["timestamp"],
+        }
+
+
+class TestSettingsCache:
+    """Tests for the get_sport_settings response cache."""
+
+    async def test_repeat_calls_served_from_cache(self, mock_ctx, respx_mock):
+        """Test that a second call within the TTL makes no request."""
+        route = respx_mock.get("/athlete/i123456/sport-settings").mock(
+            return_value=Response(200, json=[{"id": 1, "type": "Ride", "ftp": 250}])
+        )
+
+        first = await get_sport_settings(ctx=mock_ctx)
+
+        assert await get_sport_settings(ctx=mock_ctx) == first
+        assert route.call_count == 1
+
+    async def test_expired_entry_refetched(self, mock_ctx, respx_mock, monkeypatch):
+        """Test that a response older than the TTL is fetched again."""
+        route = respx_mock.get("/athlete/i123456/sport-settings").mock(
+            return_value=Response(200, json=[])
+        )
+        now = 1000.0
+        monkeypatch.setattr(sport_settings.time, "monotonic", lambda: now)
+
+        await get_sport_settings(ctx=mock_ctx)
+        now += sport_settings._SETTINGS_CACHE_TTL
+        await get_sport_settings(ctx=mock_ctx)
+
+        assert route.call_count == 2
+
+    async def test_update_invalidates(self, mock_ctx, respx_mock):
+        """Test that updating settings makes the next read hit the API."""
+        route = respx_mock.get("/athlete/i123456/sport-settings").mock(
+            side_effect=[
+                Response(200, json=[{"id": 1, "type": "Ride", "ftp": 250}]),
+                Response(200, json=[{"id": 1, "type": "Ride", "ftp": 275}]),
+            ]
+        )
+        respx_mock.put("/athlete/i123456/sport-settings/1").mock(
+            return_value=Response(200, json={"id": 1, "type": "Ride", "ftp": 275})
+        )
+
+        await get_sport_settings(ctx=mock_ctx)
+        await update_sport_settings(1, ftp=275, ctx=mock_ctx)
+        response = json.loads(await get_sport_settings(ctx=mock_ctx))
+
+        assert route.call_count == 2
+        assert response["data"]["sport_settings"][0]["ftp_watts"] == 275
+
+    async def test_read_overlapping_update_not_cached(self, mock_ctx, respx_mock):
+        """Test that a read still in flight when an update lands does not cache stale data."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        responses = iter(
+            [
+                Response(200, json=[{"id": 1, "type": "Ride", "ftp": 250}]),
+                Response(200, json=[{"id": 1, "type": "Ride", "ftp": 275}]),
+            ]
+        )
+
+        async def held_read(request):
+            if not started.is_set():
+                started.set()
+                await release.wait()
+            return next(responses)
+
+        route = respx_mock.get("/athlete/i123456/sport-settings").mock(side_effect=held_read)
+        respx_mock.put("/athlete/i123456/sport-settings/1").mock(
+            return_value=Response(200, json={"id": 1, "type": "Ride", "ftp": 275})
+        )
+
+        stale_read = asyncio.create_task(get_sport_settings(ctx=mock_ctx))
+        await started.wait()
+        await update_sport_settings(1, ftp=275, ctx=mock_ctx)
+        release.set()
+        await stale_read
+        response = json.loads(await get_sport_settings(ctx=mock_ctx))
+
+        assert route.call_count == 2
+        assert response["data"]["sport_settings"][0]["ftp_watts"] == 275
+
+    async def test_failed_update_invalidates(self, mock_ctx, respx_mock):
+        """Test that the cache is dropped even when the update request fails."""
+        route = respx_mock.get("/athlete/i123456/sport-settings").mock(
+            return_value=Response(200, json=[{"id": 1, "type": "Ride", "ftp": 250}])
+        )
+        respx_mock.put("/athlete/i123456/sport-settings/1").mock(return_value=Response(500))
+
+        await get_sport_settings(ctx=mock_ctx)
+        await update_sport_settings(1, ftp=275, ctx=mock_ctx)
+        await get_sport_settings(ctx=mock_ctx)
+
+        assert route.call_count == 2
+
+    async def test_errors_not_cached(self, mock_ctx, respx_mock):
+        """Test that a failed fetch is retried on the next call."""
+        route = respx_mock.get("/athlete/i123456/sport-settings").mock(
+            side_effect=[Response(404), Response(200, json=[])]
+        )
+
+        await get_sport_settings(ctx=mock_ctx)
+        response = json.loads(await get_sport_settings(ctx=mock_ctx))
+
+        assert route.call_count == 2
+        assert response["metadata"]["count"] == 0
+
+
+class TestUpdateSportSettings:
+    """Tests for update_sport_settings."""
+
+    async def test_no_fields_rejected(self, mock_ctx):
+        """Test that an update without any fields is a validation error."""
+        response = json.loads(await update_sport_settings(1, ctx=mock_ctx))
+
+        assert response["error"]["type"] == "validation_error"
+
+    async def test_unknown_id_reported_as_api_error(self, mock_ctx, respx_mock):
+        """Test that a 404 for the sport settings ID is reported as an api_error."""
+        respx_mock.put("/athlete/i123456/sport-settings/99").mock(return_value=Response(404))
+
+        response = json.loads(await update_sport_settings(99, ftp=250, ctx=mock_ctx))
+
+        assert response["error"]["type"] == "api_error"
+        assert response["error"]["message"] == "Resource not found."
+
+    async def test_unexpected_exception_reported(self, mock_ctx, monkeypatch):
+        """Test that non-API exceptions become unexpected_error responses."""
+
+        async def boom(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(mock_ctx.get_state("client"), "update_sport_settings", boom)
+
+        response = json.loads(await update_sport_settings(1, ftp=250, ctx=mock_ctx))
+
+        assert response["error"]["type"] == "unexpected_error"
+        assert response["error"]["message"] == "boom"
+
+
+class TestBulkUpdateSportSettings:
+    """Tests for bulk_update_sport_settings."""
+
+    async def test_updates_sent_in_one_request(self, mock_ctx, respx_mock):
+        """Test that all updates go out as a single PUT and come back summarized."""
+        route = respx_mock.put("/athlete/i123456/sport-settings").mock(
+            return_value=Response(
+                200,
+                json=[
+                    {"id": 1, "type": "Ride", "ftp": 275},
+                    {"id": 2, "type": "Run", "fthr": 170, "pace_threshold": 4.5},
+                ],
+            )
+        )
+        updates = json.dumps(
+            [
+                {"id": 1, "ftp": 275},
+                {"id": 2, "fthr": 170, "pace_threshold": 4.5, "swim_threshold": None},
+            ]
+        )
+
+        response = json.loads(await bulk_update_sport_settings(updates, ctx=mock_ctx))
+
+        assert route.call_count == 1
+        assert route.calls.last.request.url.params["recalcHrZones"] == "false"
+        assert json.loads(route.calls.last.request.content) == [
+            {"id": 1, "ftp": 275},
+            {"id": 2, "fthr": 170, "pace_threshold": 4.5},
+        ]
+        assert response["data"]["sport_settings"] == [
+            {"id": 1, "type": "Ride", "ftp_watts": 275},
+            {"id": 2, "type": "Run", "fthr_bpm": 170, "pace_threshold": "4:30 /km"},
+        ]
+        assert response["metadata"]["count"] == 2
+
+    @pytest.mark.parametrize(
+        ("updates", "message"),
+        [
+            ("[]", "non-empty JSON array"),
+            ('[{"ftp": 250}]', "'id'"),
+            ('[{"id": true, "ftp": 250}]', "'id'"),
+            ('[{"id": 1, "zones": []}]', "unknown field(s) zones"),
+            ('[{"id": 1}]', "no fields provided"),
+        ],
+    )
+    async def test_invalid_updates_rejected(self, mock_ctx, updates, message):
+        """Test that malformed updates are validation errors before any request."""
+        response = json.loads(await bulk_update_sport_settings(updates, ctx=mock_ctx))
+
+        assert response["error"]["type"] == "validation_error"
+        assert message in response["error"]["message"]